@@ -11,12 +11,14 @@ __doc__ = """Run following tests:
 
 import subprocess
 import sys
+import unittest
 
 
 def run_tests(tests):
-    for test_file in tests:
-        print(f"Running test {test_file}")
-        subprocess.run([sys.executable, '-m', f'{test_file}'])
+    print(f"Running tests {', '.join(tests)}")
+    suite = unittest.defaultTestLoader.loadTestsFromNames(tests)
+    result = unittest.TextTestRunner().run(suite)
+    return result.wasSuccessful()
 
 
 def run_linters():
@@ -50,4 +52,5 @@ if __name__ == "__main__":
     if 'lint' in command_line_args:
         run_linters()
 
-    run_tests(test_files)
+    if not run_tests(test_files):
+        sys.exit(1)
@@ -1,4 +1,6 @@
+from contextlib import contextmanager
 from enum import Enum, auto
+from functools import partial
 
 __doc__ = """Formatters for different styles of code generation
 """
@@ -14,6 +16,8 @@ class CodeLayout:
     Class defining code layout rules, such as indentation, line ending, etc.
     """
 
+    __slots__ = ("indent", "endline", "postfix", "_indent_cache")
+
     default_endline = "\n"
     default_indent = " " * 4
     default_postfix = ""
@@ -27,6 +31,53 @@ class CodeLayout:
         self.indent = self.default_indent if indent is None else indent
         self.endline = self.default_endline if endline is None else endline
         self.postfix = self.default_postfix if postfix is None else postfix
+        self._indent_cache = [""]
+
+    def indent_str(self, level):
+        """
+        @return: indentation string for the given indentation level
+        """
+        if level <= 0:
+            return ""
+        indent_cache = self._indent_cache
+        while len(indent_cache) <= level:
+            indent_cache.append(indent_cache[-1] + self.indent)
+        return indent_cache[level]
+
+
+class LineBuffer:
+    """
+    Writer which collects written strings so they could be flushed at once
+    """
+
+    __slots__ = ("parts", "write")
+
+    def __init__(self):
+        self.parts = []
+        self.write = self.parts.append
+
+    def getvalue(self):
+        return "".join(self.parts)
+
+    def close(self):
+        pass
+
+
+@contextmanager
+def batched_writer(writer):
+    """
+    Provide a LineBuffer in place of the writer and flush its content into the writer
+    with a single write call on exit, nested batches share the outermost buffer
+    """
+    if isinstance(writer, LineBuffer):
+        yield writer
+        return
+    buffer = LineBuffer()
+    try:
+        yield buffer
+    finally:
+        if buffer.parts:
+            writer.write(buffer.getvalue())
 
 
 class CodeFormatter:
@@ -34,7 +85,7 @@ class CodeFormatter:
     Base class for code close of different styles
     """
 
-    pass
+    __slots__ = ()
 
 
 class ANSICodeFormatter(CodeFormatter):
@@ -48,6 +99,18 @@ class ANSICodeFormatter(CodeFormatter):
     finishing postfix is optional (e.g. necessary for classes, unnecessary for namespaces)
     """
 
+    __slots__ = (
+        "writer",
+        "code_layout",
+        "indent_level",
+        "text",
+        "endline",
+        "postfix",
+        "braces",
+        "_open_lines",
+        "_close_lines",
+    )
+
     def __init__(
         self,
         writer,
@@ -64,7 +127,7 @@ class ANSICodeFormatter(CodeFormatter):
         """
         super().__init__()
         self.writer = writer
-        self.code_layout = code_layout or CodeLayout()
+        self.code_layout = CodeLayout() if code_layout is None else code_layout
         self.indent_level = 0 if indent is None else indent
         if isinstance(text, (list, tuple)):
             self.text = "".join(text)
@@ -73,45 +136,73 @@ class ANSICodeFormatter(CodeFormatter):
         self.endline = endline
         self.postfix = self.code_layout.postfix if postfix is None else postfix
         self.braces = braces
+        # lines opening and closing the block depend only on the block shape,
+        # so they are composed once here, not at every enter/exit
+        self._open_lines = self._block_open_lines()
+        self._close_lines = self._block_close_lines()
+
+    def _block_open_lines(self):
+        if self.endline:
+            lines = [self.text] if self.text else []
+            if self.braces:
+                lines.append("{")
+            return lines
+        text = f"{self.text} " if self.text else ""
+        if self.braces:
+            return [f"{text}{{"]
+        return [text] if text else []
+
+    def _block_close_lines(self):
+        if self.braces:
+            return ["}" + self.postfix]
+        return [self.postfix] if self.postfix else []
 
     def __call__(self, text, indent=None, endline=True):
         self.line(text, indent=indent, endline=endline)
 
     def __enter__(self):
         """Open code block."""
-        if self.endline:
-            if self.text:
-                self.line(self.text, endline=self.endline)
-            if self.braces:
-                self.line("{")
-        else:
-            text = self.text and f"{self.text} " or ""
-            if self.braces:
-                self.line(f"{text}{{")
-            else:
-                if text:
-                    self.line(f"{text}")
+        if self._open_lines:
+            self.writelines(self._open_lines)
         self.indent_level += 1
         return self
 
     def __exit__(self, *_):
         """Close code block."""
         self.indent_level -= 1
-        if self.braces:
-            self.line("}" + self.postfix)
-        else:
-            if self.postfix:
-                self.line(self.postfix)
+        if self._close_lines:
+            self.writelines(self._close_lines)
 
     def line(self, text, indent=None, endline=True):
         """Write one line into writer."""
         if indent is None:
             indent = self.indent_level
-        self.writer.write(
-            f"{self.code_layout.indent * indent}"
-            f"{text}"
-            f"{self.code_layout.endline if endline else ''}"
-        )
+        code_layout = self.code_layout
+        indent_str = code_layout.indent_str(indent)
+        endline_str = code_layout.endline if endline else ""
+        self.writer.write(f"{indent_str}{text}{endline_str}")
+
+    def writelines(self, lines, indent=None, endline=True):
+        """Write several lines into writer with a single write call."""
+        if indent is None:
+            indent = self.indent_level
+        indent_str = self.code_layout.indent_str(indent)
+        endline_str = self.code_layout.endline if endline else ""
+        self.writer.write("".join(f"{indent_str}{text}{endline_str}" for text in lines))
+
+    @contextmanager
+    def batch(self):
+        """
+        Collect all lines written in the 'with' block (including nested blocks)
+        and pass them to the writer at once on exit
+        """
+        writer = self.writer
+        with batched_writer(writer) as buffer:
+            self.writer = buffer
+            try:
+                yield self
+            finally:
+                self.writer = writer
 
     def block(self, text, endline=True, postfix=None):
         return ANSICodeFormatter(
@@ -125,14 +216,21 @@ class ANSICodeFormatter(CodeFormatter):
 
     def label(self, text):
         """Write C/C++ code label."""
-        self.line(f"{text}:", self.indent_level - 1)
+        self.line(text + ":", self.indent_level - 1)
 
     def newline(self, n=1):
         """
         Insert one or several empty lines
         """
-        for _ in range(n):
-            self.line(text="", indent=0)
+        self.writelines([""] * n, indent=0)
+
+
+# formatter class for every code format
+# TODO: leave default formatter for respective source file
+_FORMATTER_CLASSES = {
+    CodeFormat.ANSI_CPP: ANSICodeFormatter,
+    CodeFormat.DEFAULT: CodeFormatter,
+}
 
 
 class CodeFormatterFactory:
@@ -141,15 +239,15 @@ class CodeFormatterFactory:
     """
 
     @staticmethod
-    def get_code_formatter(code_format, code_layout=None) -> CodeFormatter:
+    def get_code_formatter(code_format, code_layout=None):
         """
-        Create a new code formatter
+        Create a new code formatter constructor bound to the code layout
         :param code_format: code formatter type
+        :param code_layout: code layout shared by all created formatters
         """
-        code_layout = code_layout is not None and code_layout or CodeLayout()
-        if code_format == CodeFormat.ANSI_CPP:
-            return type("Formatter", (ANSICodeFormatter,), {"code_layout": code_layout})
-        if code_format == CodeFormat.DEFAULT:
-            # TODO: leave default formatter for respective source file
-            return type("Formatter", (CodeFormatter,), {"code_layout": CodeLayout})
-        raise ValueError(f"Unknown code format: {code_format}")
+        formatter_class = _FORMATTER_CLASSES.get(code_format)
+        if formatter_class is None:
+            raise ValueError(f"Unknown code format: {code_format}")
+        if code_layout is None:
+            code_layout = CodeLayout()
+        return partial(formatter_class, code_layout=code_layout)
@@ -1,4 +1,12 @@
-from code_gen.core.code_formatter import CodeFormat, CodeFormatterFactory
+from contextlib import contextmanager
+
+from code_gen.core.code_formatter import (
+    CodeFormat,
+    CodeFormatterFactory,
+    CodeLayout,
+    LineBuffer,
+    batched_writer,
+)
 
 __doc__ = """
 Simple and straightforward code generator that could be used for generating code
@@ -33,6 +41,10 @@ public:
 """
 
 
+# size of the file buffer, generated sources are written out in large blocks
+FILE_BUFFER_SIZE = 1 << 20
+
+
 class SourceFile:
     """
     The class is a main instrument of code generation
@@ -68,19 +80,38 @@ class SourceFile:
     cpp.newline(3)
     """
 
+    __slots__ = (
+        "filename",
+        "formatter",
+        "out",
+        "code_layout",
+        "code_formatter",
+        "_out_formatter",
+    )
+
     def __init__(self, filename, formatter=None, writer=None):
         """
         Creates a new source file
         @param: filename source file to create (rewrite if exists)
         @param: formatter code formatter to define rules of code indentation and line ending
-        @param: writer optional writer to write output to
+        @param: writer optional writer to write output to, if neither filename
+        nor writer is given, the output is collected in memory (see getvalue)
         """
         self.filename = filename
         if not isinstance(formatter, CodeFormat) and formatter is not None:
             raise TypeError(f"code_format must be an instance of {CodeFormat.__name__}")
         self.formatter = formatter if formatter is not None else CodeFormat.DEFAULT
-        self.out = writer if writer is not None else open(filename, "w")
-        self.code_formatter = CodeFormatterFactory.get_code_formatter(self.formatter)
+        if writer is None:
+            if filename is None:
+                writer = LineBuffer()
+            else:
+                writer = open(filename, "w", buffering=FILE_BUFFER_SIZE)
+        self.out = writer
+        self.code_layout = CodeLayout()
+        self.code_formatter = CodeFormatterFactory.get_code_formatter(
+            self.formatter, self.code_layout
+        )
+        self._out_formatter = None
 
     def close(self):
         """
@@ -89,11 +120,32 @@ class SourceFile:
         self.out.close()
         self.out = None
 
+    def getvalue(self):
+        """
+        @return: the output collected so far, for the sources written in memory
+        """
+        return self.out.getvalue()
+
+    def _formatter(self):
+        """
+        Return formatter writing into the current output, created once per output
+        """
+        formatter = self._out_formatter
+        if formatter is None or formatter.writer is not self.out:
+            formatter = self._out_formatter = self.code_formatter(self.out)
+        return formatter
+
     def write(self, text, indent=0, endline=True):
         """
         Write a new line with line ending
         """
-        self.code_formatter(self.out).line(text, indent, endline)
+        self._formatter().line(text, indent, endline)
+
+    def writelines(self, lines, indent=0, endline=True):
+        """
+        Write several lines with line endings at once
+        """
+        self._formatter().writelines(lines, indent, endline)
 
     def __call__(self, text, indent=0, endline=True):
         """
@@ -103,6 +155,23 @@ class SourceFile:
         """
         self.write(text, indent, endline)
 
+    @contextmanager
+    def batch(self):
+        """
+        Collect all lines written in the 'with' block (including nested blocks)
+        and pass them to the output at once on exit, i.e.
+        with cpp.batch():
+            cpp('int a = 0;')
+            cpp('int b = 0;')
+        """
+        out = self.out
+        with batched_writer(out) as buffer:
+            self.out = buffer
+            try:
+                yield self
+            finally:
+                self.out = out
+
     def block(self, text=None, endline=True, postfix=None, braces=True):
         """
         Returns a stub for C++ {} close
@@ -110,7 +179,7 @@ class SourceFile:
         with cpp.block(class_name, ';'):
         """
         if postfix is None:
-            postfix = self.code_formatter.code_layout.postfix
+            postfix = self.code_layout.postfix
         return self.code_formatter(
             self.out, text=text, endline=endline, postfix=postfix, braces=braces
         )
@@ -119,5 +188,4 @@ class SourceFile:
         """
         Insert one or several empty lines
         """
-        for _ in range(n):
-            self.write(text="", indent=0)
+        self.writelines([""] * n, indent=0)
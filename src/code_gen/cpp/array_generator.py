@@ -1,4 +1,5 @@
 from .language_element import CppLanguageElement
+from .type_base_generator import _F_CONST, _F_STATIC, _DECLARATORS
 
 
 # noinspection PyUnresolvedReferences
@@ -32,6 +33,15 @@ class CppArray(CppLanguageElement):
     Methods simply returning string representation of the element start from '_'
     """
 
+    __slots__ = (
+        "type",
+        "is_static",
+        "is_const",
+        "array_size",
+        "newline_align",
+        "items",
+    )
+
     PROPERTIES = CppLanguageElement.PROPERTIES | {
         "type",
         "is_static",
@@ -62,25 +72,17 @@ class CppArray(CppLanguageElement):
     def add_array_items(self, items):
         """
         If variable is an array it could contain a number of items
-        @param: items - list of strings
+        @param: items - list of strings or numbers
         """
         self.items.extend(items)
 
     def decl_to_string(self):
-        lhr = [
-            f"{self._modifiers()}",
-            f"{self.type}",
-            f"{self.name}[{self._size()}]",
-        ]
-        return " ".join(h for h in lhr if h)
+        declarator, size = self._declarator()
+        return f"{declarator} {self.name}{size}"
 
     def full_decl_to_string(self):
-        lhr = [
-            f"{self._modifiers()}",
-            f"{self.type}",
-            f"{self.fully_qualified_name()}[{self._size()}]",
-        ]
-        return " ".join(h for h in lhr if h)
+        declarator, size = self._declarator()
+        return f"{declarator} {self.fully_qualified_name()}{size}"
 
     def render_to_string(self, cpp):
         """
@@ -170,24 +172,15 @@ class CppArray(CppLanguageElement):
         if self.is_class_member() and not self.name:
             raise RuntimeError("Class member array name is not set")
 
-    def _static(self):
-        """
-        @return: 'static' prefix if required
-        """
-        return "static" if self.is_static else ""
-
-    def _const(self):
+    def _declarator(self):
         """
-        @return: 'const' prefix if required
+        @return: array type with modifiers and array size subscript,
+        e.g. ('static const int', '[5]')
         """
-        return "const" if self.is_const else ""
-
-    def _modifiers(self):
-        modifiers = [
-            self._static(),
-            self._const(),
+        prefix, _ = _DECLARATORS[
+            (_F_STATIC if self.is_static else 0) | (_F_CONST if self.is_const else 0)
         ]
-        return " ".join(m for m in modifiers if m)
+        return f"{prefix}{self.type}", f"[{self._size()}]"
 
     def _size(self):
         """
@@ -199,7 +192,8 @@ class CppArray(CppLanguageElement):
         """
         @return: array items if any
         """
-        return ", ".join(self.items) if self.items else "nullptr"
+        # str() conversion is done by map() in C, so numeric items are fast too
+        return ", ".join(map(str, self.items)) if self.items else "nullptr"
 
     def _render_value(self, cpp):
         """
@@ -207,6 +201,9 @@ class CppArray(CppLanguageElement):
         """
         if not self.items:
             raise RuntimeError("Empty arrays do not supported")
-        for item in self.items[:-1]:
-            cpp(f"{item},")
-        cpp(f"{self.items[-1]}")
+        # all items are passed to the writer at once
+        items = self.items
+        lines = [f"{item}," for item in items]
+        # the last item has no trailing comma
+        lines[-1] = f"{items[-1]}"
+        cpp.writelines(lines)
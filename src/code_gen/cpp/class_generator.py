@@ -1,10 +1,318 @@
-from textwrap import dedent
+import sys
+from functools import lru_cache
+from itertools import chain
 
 from .language_element import CppLanguageElement
 from .function_generator import CppFunction
 from .scope_generator import CppClassScope
 
 
+# method modifiers packed into flags
+_M_STATIC = 1
+_M_CONSTEXPR = 2
+_M_VIRTUAL = 4
+_M_INLINE = 8
+_M_PURE_VIRTUAL = 16
+_M_CONST = 32
+_M_OVERRIDE = 64
+_M_FINAL = 128
+
+# modifiers placed before the return type and after the arguments respectively
+_FRONT_MODIFIERS = (
+    (_M_STATIC, sys.intern("static")),
+    (_M_CONSTEXPR, sys.intern("constexpr")),
+    (_M_VIRTUAL, sys.intern("virtual")),
+    (_M_INLINE, sys.intern("inline")),
+)
+_BACK_MODIFIERS = (
+    (_M_CONST, sys.intern("const")),
+    (_M_OVERRIDE, sys.intern("override")),
+    (_M_FINAL, sys.intern("final")),
+    (_M_PURE_VIRTUAL, sys.intern(" = 0")),
+)
+# const suffix of the method definition indexed by the boolean flag
+_CONST = ("", sys.intern(" const"))
+
+# (mask, invalid value, error message) of the invalid modifier combinations,
+# e.g. the override flag within the override | virtual mask means override without virtual
+_INVALID_METHOD_MODIFIERS = (
+    (
+        _M_INLINE | _M_VIRTUAL,
+        _M_INLINE | _M_VIRTUAL,
+        "Inline method {} could not be virtual",
+    ),
+    (
+        _M_INLINE | _M_PURE_VIRTUAL,
+        _M_INLINE | _M_PURE_VIRTUAL,
+        "Inline method {} could not be virtual",
+    ),
+    (
+        _M_CONSTEXPR | _M_VIRTUAL,
+        _M_CONSTEXPR | _M_VIRTUAL,
+        "Constexpr method {} could not be virtual",
+    ),
+    (
+        _M_CONSTEXPR | _M_PURE_VIRTUAL,
+        _M_CONSTEXPR | _M_PURE_VIRTUAL,
+        "Constexpr method {} could not be virtual",
+    ),
+    (_M_CONST | _M_STATIC, _M_CONST | _M_STATIC, "Static method {} could not be const"),
+    (
+        _M_CONST | _M_VIRTUAL,
+        _M_CONST | _M_VIRTUAL,
+        "Virtual method {} could not be const",
+    ),
+    (
+        _M_CONST | _M_PURE_VIRTUAL,
+        _M_CONST | _M_PURE_VIRTUAL,
+        "Pure virtual method {} could not be const",
+    ),
+    (_M_OVERRIDE | _M_VIRTUAL, _M_OVERRIDE, "Override method {} should be virtual"),
+    (_M_FINAL | _M_VIRTUAL, _M_FINAL, "Final method {} should be virtual"),
+    (
+        _M_STATIC | _M_VIRTUAL,
+        _M_STATIC | _M_VIRTUAL,
+        "Static method {} could not be virtual",
+    ),
+    (
+        _M_PURE_VIRTUAL | _M_VIRTUAL,
+        _M_PURE_VIRTUAL,
+        "Pure virtual method {} is also a virtual method",
+    ),
+)
+
+# modifiers a constructor cannot be declared with, in the order they are reported
+_CTOR_PROHIBITED_MODIFIERS = (
+    (_M_STATIC, "static"),
+    (_M_CONSTEXPR, "constexpr"),
+    (_M_VIRTUAL, "virtual"),
+    (_M_INLINE, "inline"),
+    (_M_PURE_VIRTUAL, "pure_virtual"),
+    (_M_CONST, "const"),
+    (_M_OVERRIDE, "override"),
+    (_M_FINAL, "final"),
+)
+
+
+@lru_cache(maxsize=None)
+def _method_modifiers(flags):
+    """
+    Compose the method modifiers, the result is computed once for every combination
+    @return: (front, back) strings including the separating spaces, front goes before
+    the return type (e.g. 'static ', 'virtual inline '), back goes after the arguments
+    (e.g. ' const override'), both are empty if there are no such modifiers
+    """
+    front = "".join(
+        f"{keyword} " for flag, keyword in _FRONT_MODIFIERS if flags & flag
+    )
+    back = "".join(f" {keyword}" for flag, keyword in _BACK_MODIFIERS if flags & flag)
+    return sys.intern(front), sys.intern(back)
+
+
+class _CppMethod(CppFunction):
+    """
+    The Python class that generates string representation for C++ method
+    Parameters are passed as plain strings('int a', 'void p = NULL' etc.)
+    Available properties:
+    ret_type - string, return value for the method ('void', 'int'). Could not be set for constructors
+    is_static - boolean, static method prefix
+    is_const - boolean, const method prefix, could not be static
+    is_virtual - boolean, virtual method postfix, could not be static
+    is_pure_virtual - boolean, ' = 0' method postfix, could not be static
+    documentation - string, '/// Example doxygen'
+    implementation - reference to a function that receives 'self' and C++ code generator handle
+    (see code_generator.cpp) and generates method body without braces
+    Ex.
+    #Python code
+    def functionBody(self, cpp): cpp('return 42;')
+    f1 = CppFunction(name = 'GetAnswer',
+                     ret_type = 'int',
+                     documentation = '// Generated code',
+                     implementation = functionBody)
+
+    // Generated code
+    int MyClass::GetAnswer()
+    {
+        return 42;
+    }
+    """
+
+    __slots__ = (
+        "is_static",
+        "is_virtual",
+        "is_inline",
+        "is_pure_virtual",
+        "is_const",
+        "is_override",
+        "is_final",
+    )
+
+    PROPERTIES = CppFunction.PROPERTIES | {
+        "ret_type",
+        "is_static",
+        "is_constexpr",
+        "is_virtual",
+        "is_inline",
+        "is_pure_virtual",
+        "is_const",
+        "is_override",
+        "is_final",
+        "arguments",
+        "implementation",
+        "documentation",
+    }
+
+    def __init__(self, **properties):
+        # arguments are plain strings
+        # e.g. 'int* a', 'const string& s', 'size_t sz = 10'
+        # the method own defaults go first, CppFunction sets the rest and
+        # initializes all the properties at once
+        self.is_static = False
+        self.is_virtual = False
+        self.is_inline = False
+        self.is_pure_virtual = False
+        self.is_const = False
+        self.is_override = False
+        self.is_final = False
+        super().__init__(**properties)
+
+    def short_header_declaration_to_string(self):
+        front, back = self._modifiers()
+        ret_type = self._ret_type(local_scope=True)
+        return f"{front}{ret_type}{self.name}({self.args()}){back}"
+
+    def short_header_implementation_to_string(self):
+        return self.short_header_declaration_to_string()
+
+    def full_header_implementation_to_string(self):
+        ret_type = self._ret_type(local_scope=False)
+        # const is the only modifier repeated in the definition
+        const = _CONST[bool(self.is_const)]
+        return f"{ret_type}{self.fully_qualified_name()}({self.args()}){const}"
+
+    def render_to_string(self, cpp):
+        """
+        By default, method is rendered as a declaration together with implementation,
+        like the method is implemented within the C++ class body, e.g.
+        class A
+        {
+            void f()
+            {
+            ...
+            }
+        }
+        """
+        # check all properties for the consistency
+        self._sanity_check()
+        if self._documentation_dedented is not None:
+            cpp(self._documentation_dedented)
+
+        if self.implementation is None:
+            raise RuntimeError(
+                f"No implementation handle for the method {self.name}"
+            )
+
+        with cpp.block(self.short_header_implementation_to_string()) as block:
+            self.implementation(block)
+
+    def render_to_string_declaration(self, cpp):
+        """
+        Special case for a method declaration string representation.
+        Generates just a function signature terminated by ';'
+        Example:
+        int GetX() const;
+        """
+        # check all properties for the consistency
+        self._sanity_check()
+        if self.is_constexpr:
+            if self._documentation_dedented is not None:
+                cpp(self._documentation_dedented)
+            self.render_to_string(cpp)
+        else:
+            cpp(f"{self.short_header_declaration_to_string()};")
+
+    def render_to_string_implementation(self, cpp):
+        """
+        Special case for a method implementation string representation.
+        Generates method string in the form
+        Example:
+        int MyClass::GetX() const
+        {
+        ...
+        }
+        Generates method body if `self.implementation` property exists
+        """
+        # check all properties for the consistency
+        self._sanity_check()
+
+        if self.implementation is None:
+            raise RuntimeError(
+                f"No implementation handle for the method {self.name}"
+            )
+
+        if self.is_pure_virtual:
+            raise RuntimeError(
+                f"Pure virtual method {self.name} could not be implemented"
+            )
+
+        if self._documentation_dedented is not None and not self.is_constexpr:
+            cpp(self._documentation_dedented)
+        with cpp.block(self.full_header_implementation_to_string()) as block:
+            self.implementation(block)
+
+    def _sanity_check(self):
+        """
+        Check whether attributes compose a correct C++ code
+        """
+        flags = self._flags()
+        for mask, invalid, message in _INVALID_METHOD_MODIFIERS:
+            if flags & mask == invalid:
+                raise ValueError(message.format(self.name))
+        if not self.ref_to_parent:
+            raise ValueError(
+                f"Method {self.name} object must be a child of CppClass"
+            )
+        if self.is_constexpr and self.implementation is None:
+            raise ValueError(
+                f'Method {self.name} object must be initialized when "constexpr"'
+            )
+        if self.is_pure_virtual and self.implementation is not None:
+            raise ValueError(
+                f"Pure virtual method {self.name} could not be implemented"
+            )
+
+    def _flags(self):
+        """
+        @return: method modifiers packed into int flags
+        """
+        return (
+            (_M_STATIC if self.is_static else 0)
+            | (_M_CONSTEXPR if self.is_constexpr else 0)
+            | (_M_VIRTUAL if self.is_virtual else 0)
+            | (_M_INLINE if self.is_inline else 0)
+            | (_M_PURE_VIRTUAL if self.is_pure_virtual else 0)
+            | (_M_CONST if self.is_const else 0)
+            | (_M_OVERRIDE if self.is_override else 0)
+            | (_M_FINAL if self.is_final else 0)
+        )
+
+    def _modifiers(self):
+        """
+        @return: (front, back) modifiers of the method declaration
+        """
+        return _method_modifiers(self._flags())
+
+    def _ret_type(self, local_scope):
+        """
+        Return type followed by a space, could be in declaration or definition
+        """
+        if self.ret_type:
+            ret_type = CppLanguageElement.resolved_name(self.ret_type, local_scope)
+            if ret_type:
+                return f"{ret_type} "
+        return ""
+
+
 class CppClass(CppClassScope):
     """
     The Python class that generates string representation for C++ class or struct.
@@ -46,305 +354,24 @@ class CppClass(CppClassScope):
     }
     """
 
+    __slots__ = (
+        "is_struct",
+        "parent_class",
+    )
+
     PROPERTIES = CppClassScope.PROPERTIES | {
         "is_struct",
         "parent_class",
     }
 
-    class CppMethod(CppFunction):
-        """
-        The Python class that generates string representation for C++ method
-        Parameters are passed as plain strings('int a', 'void p = NULL' etc.)
-        Available properties:
-        ret_type - string, return value for the method ('void', 'int'). Could not be set for constructors
-        is_static - boolean, static method prefix
-        is_const - boolean, const method prefix, could not be static
-        is_virtual - boolean, virtual method postfix, could not be static
-        is_pure_virtual - boolean, ' = 0' method postfix, could not be static
-        documentation - string, '/// Example doxygen'
-        implementation - reference to a function that receives 'self' and C++ code generator handle
-        (see code_generator.cpp) and generates method body without braces
-        Ex.
-        #Python code
-        def functionBody(self, cpp): cpp('return 42;')
-        f1 = CppFunction(name = 'GetAnswer',
-                         ret_type = 'int',
-                         documentation = '// Generated code',
-                         implementation = functionBody)
-
-        // Generated code
-        int MyClass::GetAnswer()
-        {
-            return 42;
-        }
-        """
-
-        PROPERTIES = CppFunction.PROPERTIES | {
-            "ret_type",
-            "is_static",
-            "is_constexpr",
-            "is_virtual",
-            "is_inline",
-            "is_pure_virtual",
-            "is_const",
-            "is_override",
-            "is_final",
-            "arguments",
-            "implementation",
-            "documentation",
-        }
-
-        def __init__(self, **properties):
-            # arguments are plain strings
-            # e.g. 'int* a', 'const string& s', 'size_t sz = 10'
-            super().__init__()
-            self.ret_type = None
-            self.is_static = False
-            self.is_constexpr = False
-            self.is_virtual = False
-            self.is_inline = False
-            self.is_pure_virtual = False
-            self.is_const = False
-            self.is_override = False
-            self.is_final = False
-            self.arguments = []
-            self.implementation = None
-            self.documentation = None
-            self.init_properties(properties)
-
-        def add_argument(self, argument):
-            """
-            @param: argument string representation of the C++ function argument ('int a', 'void p = NULL' etc)
-            """
-            self.arguments.append(argument)
-
-        def args(self):
-            """
-            @return: string arguments
-            """
-            return ", ".join(self.arguments)
-
-        def body(self, cpp):
-            """
-            The method calls Python function that creates C++ method body if handle exists
-            """
-            if self.implementation is not None:
-                self.implementation(cpp)
-
-        def short_header_declaration_to_string(self):
-            header = [
-                f"{self._static()}",
-                f"{self._modifiers_front()}",
-                f"{self._ret_type(local_scope=True)}",
-                f"{self.name}({self.args()})",
-                f"{self._modifiers_back()}",
-                f"{self._pure()}",
-            ]
-            return " ".join(h for h in header if h)
-
-        def short_header_implementation_to_string(self):
-            return self.short_header_declaration_to_string()
-
-        def full_header_implementation_to_string(self):
-            header = [
-                f"{self._ret_type(local_scope=False)}",
-                f"{self.fully_qualified_name()}({self.args()})",
-                f"{self._const()}",
-            ]
-            return " ".join(h for h in header if h)
-
-        def render_to_string(self, cpp):
-            """
-            By default, method is rendered as a declaration together with implementation,
-            like the method is implemented within the C++ class body, e.g.
-            class A
-            {
-                void f()
-                {
-                ...
-                }
-            }
-            """
-            # check all properties for the consistency
-            self._sanity_check()
-            if self.documentation:
-                cpp(dedent(self.documentation))
-
-            if self.implementation is None:
-                raise RuntimeError(
-                    f"No implementation handle for the method {self.name}"
-                )
-
-            with cpp.block(self.short_header_implementation_to_string()) as block:
-                self.implementation(block)
-
-        def render_to_string_declaration(self, cpp):
-            """
-            Special case for a method declaration string representation.
-            Generates just a function signature terminated by ';'
-            Example:
-            int GetX() const;
-            """
-            # check all properties for the consistency
-            self._sanity_check()
-            if self.is_constexpr:
-                if self.documentation:
-                    cpp(dedent(self.documentation))
-                self.render_to_string(cpp)
-            else:
-                cpp(f"{self.short_header_declaration_to_string()};")
-
-        def render_to_string_implementation(self, cpp):
-            """
-            Special case for a method implementation string representation.
-            Generates method string in the form
-            Example:
-            int MyClass::GetX() const
-            {
-            ...
-            }
-            Generates method body if `self.implementation` property exists
-            """
-            # check all properties for the consistency
-            self._sanity_check()
-
-            if self.implementation is None:
-                raise RuntimeError(
-                    f"No implementation handle for the method {self.name}"
-                )
-
-            if self.is_pure_virtual:
-                raise RuntimeError(
-                    f"Pure virtual method {self.name} could not be implemented"
-                )
-
-            if self.documentation and not self.is_constexpr:
-                cpp(dedent(self.documentation))
-            with cpp.block(self.full_header_implementation_to_string()) as block:
-                self.implementation(block)
-
-        def _sanity_check(self):
-            """
-            Check whether attributes compose a correct C++ code
-            """
-            if self.is_inline and (self.is_virtual or self.is_pure_virtual):
-                raise ValueError(f"Inline method {self.name} could not be virtual")
-            if self.is_constexpr and (self.is_virtual or self.is_pure_virtual):
-                raise ValueError(f"Constexpr method {self.name} could not be virtual")
-            if self.is_const and self.is_static:
-                raise ValueError(f"Static method {self.name} could not be const")
-            if self.is_const and self.is_virtual:
-                raise ValueError(f"Virtual method {self.name} could not be const")
-            if self.is_const and self.is_pure_virtual:
-                raise ValueError(f"Pure virtual method {self.name} could not be const")
-            if self.is_override and not self.is_virtual:
-                raise ValueError(f"Override method {self.name} should be virtual")
-            if self.is_inline and (self.is_virtual or self.is_pure_virtual):
-                raise ValueError(f"Inline method {self.name} could not be virtual")
-            if self.is_final and not self.is_virtual:
-                raise ValueError(f"Final method {self.name} should be virtual")
-            if self.is_static and self.is_virtual:
-                raise ValueError(f"Static method {self.name} could not be virtual")
-            if self.is_pure_virtual and not self.is_virtual:
-                raise ValueError(
-                    f"Pure virtual method {self.name} is also a virtual method"
-                )
-            if not self.ref_to_parent:
-                raise ValueError(
-                    f"Method {self.name} object must be a child of CppClass"
-                )
-            if self.is_constexpr and self.implementation is None:
-                raise ValueError(
-                    f'Method {self.name} object must be initialized when "constexpr"'
-                )
-            if self.is_pure_virtual and self.implementation is not None:
-                raise ValueError(
-                    f"Pure virtual method {self.name} could not be implemented"
-                )
-
-        def _modifiers_front(self):
-            modifiers = [
-                self._constexpr(),
-                self._virtual(),
-                self._inline(),
-            ]
-            return " ".join(m for m in modifiers if m)
-
-        def _modifiers_back(self):
-            modifiers = [
-                self._const(),
-                self._override(),
-                self._final(),
-            ]
-            return " ".join(m for m in modifiers if m)
-
-        def _static(self):
-            """
-            Before function name, declaration only
-            Static functions can't be const, virtual or pure virtual
-            """
-            return "static" if self.is_static else ""
-
-        def _constexpr(self):
-            """
-            Before function name, declaration only
-            Constexpr functions can't be const, virtual or pure virtual
-            """
-            return "constexpr" if self.is_constexpr else ""
-
-        def _virtual(self):
-            """
-            Before function name, could be in declaration or definition
-            Virtual functions can't be static or constexpr
-            """
-            return "virtual" if self.is_virtual else ""
-
-        def _inline(self):
-            """
-            Before function name, could be in declaration or definition
-            Inline functions can't be static, virtual or constexpr
-            """
-            return "inline" if self.is_inline else ""
-
-        def _ret_type(self, local_scope):
-            """
-            Return type, could be in declaration or definition
-            """
-            if self.ret_type:
-                return CppLanguageElement.resolved_name(self.ret_type, local_scope)
-            return ""
-
-        def _pure(self):
-            """
-            After function name, declaration only
-            Pure virtual functions must be virtual
-            """
-            return " = 0" if self.is_pure_virtual else ""
-
-        def _const(self):
-            """
-            After function name, could be in declaration or definition
-            Const functions can't be static, virtual or constexpr
-            """
-            return "const" if self.is_const else ""
-
-        def _override(self):
-            """
-            After function name, could be in declaration or definition
-            Override functions must be virtual
-            """
-            return "override" if self.is_override else ""
-
-        def _final(self):
-            """
-            After function name, could be in declaration or definition
-            Final functions must be virtual
-            """
-            return "final" if self.is_final else ""
+    # defined at the module level, kept here for backward compatibility
+    CppMethod = _CppMethod
 
     class CppCtor(CppMethod):
         """Constructor method."""
 
+        __slots__ = ("initializers",)
+
         PROPERTIES = CppLanguageElement.PROPERTIES | {
             "arguments",
             "initializers",
@@ -355,52 +382,35 @@ class CppClass(CppClassScope):
         def __init__(self, **properties):
             # arguments are plain strings
             # e.g. 'int* a', 'const string& s', 'size_t sz = 10'
-            super().__init__()
-            self.arguments = []
             self.initializers = []
-            self.implementation = None
-            self.documentation = None
-            self.init_properties(properties)
+            super().__init__(**properties)
 
         def _sanity_check(self):
             """
             Check whether attributes compose a correct C++ code
             """
-            PROHIBITED_ATTRS = [
-                "ret_type",
-                "static",
-                "constexpr",
-                "virtual",
-                "inline",
-                "pure_virtual",
-                "const",
-                "override",
-                "final",
-            ]
-
-            for attr in PROHIBITED_ATTRS:
-                attr_val = getattr(self, attr, None) or getattr(
-                    self, f"is_{attr}", None
-                )
-                if attr_val:
-                    raise ValueError(f"{self.name} ctor cannot be declared with {attr}")
+            if self.ret_type:
+                raise ValueError(f"{self.name} ctor cannot be declared with ret_type")
+            flags = self._flags()
+            if flags:
+                for flag, attr in _CTOR_PROHIBITED_MODIFIERS:
+                    if flags & flag:
+                        raise ValueError(
+                            f"{self.name} ctor cannot be declared with {attr}"
+                        )
 
         def short_header_declaration_to_string(self):
             return f"{self.name}({self.args()})"
 
         def short_header_implementation_to_string(self):
-            header = [
-                f"{self.name}({self.args()})",
-                f"{self._member_initializers()}",
-            ]
-            return " ".join(h for h in header if h)
+            header = f"{self.name}({self.args()})"
+            initializers = self._member_initializers()
+            return f"{header} {initializers}" if initializers else header
 
         def full_header_implementation_to_string(self):
-            header = [
-                f"{self.fully_qualified_name()}({self.args()})",
-                f"{self._member_initializers()}",
-            ]
-            return " ".join(h for h in header if h)
+            header = f"{self.fully_qualified_name()}({self.args()})"
+            initializers = self._member_initializers()
+            return f"{header} {initializers}" if initializers else header
 
         def _member_initializers(self):
             """Return member initializer list for ctor implementation."""
@@ -424,35 +434,22 @@ class CppClass(CppClassScope):
             return ", ".join(out_list)
 
     def __init__(self, **properties):
-        super().__init__()
         self.is_struct = False
         self.parent_class = None
-        self.init_properties(properties)
+        super().__init__(**properties)
 
     def inherits(self):
         """
-        @return: string representation of the inheritance
+        @return: string representation of the inheritance, empty if there is no parent
         """
-        if self._parent_class():
-            return f" : public {self._parent_class()}"
+        return f" : public {self.parent_class}" if self.parent_class else ""
 
     # group generated sections
     def anything_public_to_declare(self):
-        return any(
-            [
-                self.scoped_enums,
-                self.internal_class_elements,
-                self.methods,
-            ]
-        )
+        return bool(self.scoped_enums or self.internal_class_elements or self.methods)
 
     def anything_private_to_declare(self):
-        return any(
-            [
-                self.variable_members,
-                self.array_members,
-            ]
-        )
+        return bool(self.variable_members or self.array_members)
 
     def class_interface(self, cpp):
         """
@@ -467,8 +464,9 @@ class CppClass(CppClassScope):
             cpp.label("public")
 
         self.render_enum_declaration(cpp)
-        self.render_internal_classes_declaration(cpp)
-        self.render_methods_declaration(cpp)
+        # nested classes and methods are declared the same way, so in a single pass
+        for item in chain(self.internal_class_elements, self.methods):
+            item.render_to_string_declaration(cpp)
 
     def private_class_members(self, cpp):
         """
@@ -482,8 +480,8 @@ class CppClass(CppClassScope):
         if not self.is_struct and self.anything_public_to_declare():
             cpp.label("private")
 
-        self.render_variables_declaration(cpp)
-        self.render_array_declaration(cpp)
+        for item in chain(self.variable_members, self.array_members):
+            item.render_to_string_declaration(cpp)
 
     def render_to_string(self, cpp):
         """
@@ -494,45 +492,48 @@ class CppClass(CppClassScope):
         self.render_to_string_declaration(cpp)
         self.render_to_string_implementation(cpp)
 
+    def render_to_files(self, header, cpp):
+        """
+        Render class declaration to 'header' and definition to 'cpp',
+        the same as render_to_string_declaration(header) followed by
+        render_to_string_implementation(cpp)
+        """
+        self.render_to_string_declaration(header)
+        self.render_to_string_implementation(cpp)
+
     def render_to_string_declaration(self, cpp):
         """
         Render to string class declaration.
         Typically handle to header should be passed as 'cpp' param
         """
-        if self.documentation:
-            cpp(dedent(self.documentation))
-
-        render_str = f"{self._class_type()} {self.name}"
-        if self._parent_class():
-            render_str += self.inherits()
-
-        with cpp.block(render_str, postfix=";") as block:
-            # in case of struct all members meant to be public
-            self.class_interface(block)
-            self.private_class_members(block)
-            self.render_internal_scopes_declarations(block)
-            self.render_postfix_lines(block)
+        # the whole declaration, nested classes included, is written at once
+        with cpp.batch():
+            if self._documentation_dedented is not None:
+                cpp(self._documentation_dedented)
+
+            with cpp.block(self._class_header(), postfix=";") as block:
+                # in case of struct all members meant to be public
+                self.class_interface(block)
+                self.private_class_members(block)
+                self.render_internal_scopes_declarations(block)
+                self.render_postfix_lines(block)
 
     def render_to_string_implementation(self, cpp):
         """
         Render to string class definition.
         Typically handle to *.cpp file should be passed as 'cpp' param
         """
-        self.render_static_members_implementation(cpp)
-        self.render_methods_implementation(cpp)
-        self.render_internal_classes_implementation(cpp)
-        self.render_internal_scopes_implementation(cpp)
+        with cpp.batch():
+            self.render_static_members_implementation(cpp)
+            self.render_methods_implementation(cpp)
+            self.render_internal_classes_implementation(cpp)
+            self.render_internal_scopes_implementation(cpp)
 
     ########################################
     # PRIVATE METHODS
-    def _class_type(self):
-        """
-        @return: 'class' or 'struct' keyword
-        """
-        return "struct" if self.is_struct else "class"
-
-    def _parent_class(self):
+    def _class_header(self):
         """
-        @return: parent class object
+        @return: class declaration header, e.g. 'class MyClass : public Base'
         """
-        return self.parent_class if self.parent_class else ""
+        class_type = "struct" if self.is_struct else "class"
+        return f"{class_type} {self.name}{self.inherits()}"
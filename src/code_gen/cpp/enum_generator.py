@@ -30,6 +30,13 @@ class CppEnum(CppLanguageElement):
     Methods simply returning string representation of the element start from '_'
     """
 
+    __slots__ = (
+        "prefix",
+        "is_enum_class",
+        "add_counter",
+        "enum_items",
+    )
+
     PROPERTIES = CppLanguageElement.PROPERTIES | {
         "prefix",
         "is_enum_class",
@@ -40,7 +47,7 @@ class CppEnum(CppLanguageElement):
     def __init__(self, **properties):
         super().__init__()
         self.prefix = None
-        self.enum_class = False
+        self.is_enum_class = False
         self.add_counter = True
         self.enum_items = []
         self.init_properties(properties)
@@ -58,12 +65,7 @@ class CppEnum(CppLanguageElement):
         self.enum_items.extend(items)
 
     def short_header_declaration_to_string(self):
-        header = [
-            "enum",
-            f"{self._enum_class()}",
-            f"{self.name}",
-        ]
-        return " ".join(h for h in header if h)
+        return f"enum class {self.name}" if self.is_enum_class else f"enum {self.name}"
 
     def render_to_string(self, cpp):
         """
@@ -75,17 +77,16 @@ class CppEnum(CppLanguageElement):
             eMyEnumCount = 2
         }
         """
-        counter = 0
         final_prefix = self.prefix if self.prefix is not None else "e"
-        with cpp.block(
+        lines = [
+            f"{final_prefix}{item} = {counter},"
+            for counter, item in enumerate(self.enum_items)
+        ]
+        if self.add_counter in (None, True):
+            lines.append(f"{final_prefix}{self.name}Count = {len(self.enum_items)}")
+        # the enum header, items and closing brace are written at once
+        with cpp.batch(), cpp.block(
             self.short_header_declaration_to_string(), endline=False, postfix=";"
         ) as block:
-            for item in self.enum_items:
-                block(f"{final_prefix}{item} = {counter},")
-                counter += 1
-            if self.add_counter in [None, True]:
-                last_element = f"{final_prefix}{self.name}Count = {counter}"
-                block(last_element)
-
-    def _enum_class(self):
-        return "class" if self.is_enum_class else ""
+            if lines:
+                block.writelines(lines)
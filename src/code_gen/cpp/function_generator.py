@@ -1,5 +1,3 @@
-from textwrap import dedent
-
 from .language_element import CppLanguageElement
 
 
@@ -28,6 +26,14 @@ class CppFunction(CppLanguageElement):
     }
     """
 
+    __slots__ = (
+        "ret_type",
+        "is_constexpr",
+        "arguments",
+        "implementation",
+        "is_method",
+    )
+
     PROPERTIES = CppLanguageElement.PROPERTIES | {
         "ret_type",
         "is_constexpr",
@@ -54,20 +60,13 @@ class CppFunction(CppLanguageElement):
         if self.is_constexpr and self.implementation is None:
             raise ValueError(f"Constexpr function {self.name} must have implementation")
 
-    def _constexpr(self):
-        """
-        Before function name, declaration only
-        Constexpr functions can't be const, virtual or pure virtual
-        """
-        return "constexpr" if self.is_constexpr else ""
-
     def short_header_declaration_to_string(self):
-        header = [
-            f"{self._constexpr()}",
-            f"{self.ret_type}",
-            f"{self.name}({self.args()})",
-        ]
-        return " ".join(h for h in header if h)
+        prefix = "constexpr " if self.is_constexpr else ""
+        # an empty return type adds no separator
+        ret_type = f"{self.ret_type}"
+        if ret_type:
+            ret_type += " "
+        return f"{prefix}{ret_type}{self.name}({self.args()})"
 
     def args(self):
         """
@@ -92,12 +91,14 @@ class CppFunction(CppLanguageElement):
         """Function is rendered as with implementation"""
         # check all properties for the consistency
         self._sanity_check()
-        if self.documentation:
-            cpp(dedent(self.documentation))
+        if self._documentation_dedented is not None:
+            cpp(self._documentation_dedented)
+        implementation = self.implementation
         with cpp.block(
             self.short_header_declaration_to_string(), endline=False
         ) as block:
-            self.body(block)
+            if implementation is not None:
+                implementation(block)
 
     def render_to_string_declaration(self, cpp):
         """
@@ -108,8 +109,8 @@ class CppFunction(CppLanguageElement):
         """
         # check all properties for the consistency
         if self.is_constexpr:
-            if self.documentation:
-                cpp(dedent(self.documentation))
+            if self._documentation_dedented is not None:
+                cpp(self._documentation_dedented)
             self.render_to_string(cpp)
         else:
             cpp(f"{self.short_header_declaration_to_string()};")
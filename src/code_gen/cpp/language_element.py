@@ -1,3 +1,5 @@
+from textwrap import dedent
+
 __doc__ = """The module encapsulates C++ code generation logics for main C++ language primitives:
 classes, methods and functions, variables, enums.
 Every C++ element could render its current state to a string that could be evaluated as
@@ -41,6 +43,16 @@ cpp.append(', p = NULL);')
 - empty lines:
 cpp.newline(2)
 
+- several lines at once:
+cpp.writelines(['int a = 10;', 'int b = 20;'])
+
+- batches, the lines written in the block are passed to the output at once:
+with cpp.batch():
+    cpp('int a = 10;')
+
+The elements render themselves through this interface, so a custom 'cpp' handle
+passed to render_to_string* methods has to provide all the calls above.
+
 For more detailed information see SourceFile and CppSourceFile documentation.
 """
 
@@ -83,6 +95,16 @@ class CppImplementation:
         self.cpp_element.render_to_string_implementation(cpp)
 
 
+def _normalize_map(properties):
+    """
+    Map every accepted property name to its canonical name in properties,
+    i.e. both "const" and "is_const" map to "is_const".
+    """
+    normalize_map = {name[3:]: name for name in properties if name.startswith("is_")}
+    normalize_map.update((name, name) for name in properties)
+    return normalize_map
+
+
 class CppLanguageElement:
     """
     The base class for all C++ language elements.
@@ -90,10 +112,25 @@ class CppLanguageElement:
     (e.g. is_static for the variable is_virtual for the class method etc.)
     """
 
-    PROPERTIES = {
+    __slots__ = (
         "name",
         "ref_to_parent",
-    }
+        "_documentation",
+        "_documentation_dedented",
+    )
+
+    # immutable, derived classes extend it with '|' which again yields a frozenset
+    PROPERTIES = frozenset(
+        {
+            "name",
+            "ref_to_parent",
+        }
+    )
+    _NORMALIZE_MAP = _normalize_map(PROPERTIES)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._NORMALIZE_MAP = _normalize_map(cls.PROPERTIES)
 
     def __init__(self):
         """
@@ -103,15 +140,26 @@ class CppLanguageElement:
         self.name = None
         self.ref_to_parent = None
 
+    @property
+    def documentation(self):
+        """Documentation string of elements supporting it (see the respective PROPERTIES)."""
+        return self._documentation
+
+    @documentation.setter
+    def documentation(self, value):
+        self._documentation = value
+        # dedent only once, when set, not at every rendering,
+        # None stands for no documentation to render
+        self._documentation_dedented = dedent(value) if value else None
+
     def _normalize_properties(self, properties):
         """Produce properties with normalized names, i.e. substitute "const" with "is_const"."""
-        result = {}
-        for name, val in properties.items():
-            if name in self.PROPERTIES:
-                result[name] = val
-            if f"is_{name}" in self.PROPERTIES:
-                result[f"is_{name}"] = val
-        return result
+        normalize_map = self._NORMALIZE_MAP
+        return {
+            normalize_map[name]: val
+            for name, val in properties.items()
+            if name in normalize_map
+        }
 
     def _parent_qualifier(self):
         """
@@ -141,14 +189,12 @@ class CppLanguageElement:
         @param: default_property_value - value for properties that are not initialized
         (None by default, because of same as False semantic)
         """
-        # Set all properties not listed in PROPERTIES to default_property_value
-        defaults = {
-            name: default_property_value
-            for name in self.PROPERTIES
-            if not hasattr(self, name)
-        }
-        defaults.update(self._normalize_properties(input_properties_dict))
-        for name, val in defaults.items():
+        properties = self._normalize_properties(input_properties_dict)
+        # Set all properties neither initialized yet nor given to default_property_value
+        for name in self.PROPERTIES:
+            if name not in properties and not hasattr(self, name):
+                setattr(self, name, default_property_value)
+        for name, val in properties.items():
             setattr(self, name, val)
 
     def fully_qualified_name(self):
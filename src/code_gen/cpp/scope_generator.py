@@ -1,4 +1,4 @@
-from textwrap import dedent
+from itertools import chain
 
 from .language_element import CppLanguageElement
 
@@ -8,6 +8,17 @@ class CppClassScope(CppLanguageElement):
     An abstract scope which can accommodated different language elements and can be used to define different sections of class or struct.
     """
 
+    __slots__ = (
+        "scope",
+        "internal_class_elements",
+        "variable_members",
+        "array_members",
+        "methods",
+        "scoped_enums",
+        "internal_scopes",
+        "postfix_lines",
+    )
+
     PROPERTIES = CppLanguageElement.PROPERTIES | {
         "documentation",
         "scope",
@@ -90,21 +101,19 @@ class CppClassScope(CppLanguageElement):
         """
         Checks if there is any local element (without nested scopes) which should be declared.
         """
-        return any(
-            [
-                self.internal_class_elements,
-                self.scoped_enums,
-                self.variable_members,
-                self.array_members,
-                self.methods,
-            ]
+        return bool(
+            self.internal_class_elements
+            or self.scoped_enums
+            or self.variable_members
+            or self.array_members
+            or self.methods
         )
 
     def anything_to_declare(self):
         """
         Checks if there is any element which should be declared.
         """
-        return self.internal_scopes or self.anything_to_declare_local()
+        return bool(self.internal_scopes) or self.anything_to_declare_local()
 
     def render_internal_classes_declaration(self, cpp):
         """
@@ -113,7 +122,7 @@ class CppClassScope(CppLanguageElement):
         Method is protected as it is used by CppClass only
         """
         for class_item in self.internal_class_elements:
-            class_item.declaration().render_to_string(cpp)
+            class_item.render_to_string_declaration(cpp)
 
     def render_enum_declaration(self, cpp):
         """
@@ -129,7 +138,7 @@ class CppClassScope(CppLanguageElement):
         Method is protected as it is used by CppClass only
         """
         for var_item in self.variable_members:
-            var_item.declaration().render_to_string(cpp)
+            var_item.render_to_string_declaration(cpp)
 
     def render_array_declaration(self, cpp):
         """
@@ -137,7 +146,7 @@ class CppClassScope(CppLanguageElement):
         Method is protected as it is used by CppClass only
         """
         for arr_item in self.array_members:
-            arr_item.declaration().render_to_string(cpp)
+            arr_item.render_to_string_declaration(cpp)
 
     def render_methods_declaration(self, cpp):
         """
@@ -153,14 +162,14 @@ class CppClassScope(CppLanguageElement):
         Generates sections of nested scopes (with labels if given)
         """
         for scope_item in self.internal_scopes:
-            scope_item.declaration().render_to_string(cpp)
+            scope_item.render_to_string_declaration(cpp)
 
     def render_postfix_lines(self, cpp):
         """
         Generate postfix lines in the scope. Could be anything.
         """
-        for postfix_line in self.postfix_lines:
-            cpp(postfix_line)
+        if self.postfix_lines:
+            cpp.writelines(self.postfix_lines)
 
     def render_to_string_declaration(self, cpp):
         """
@@ -172,17 +181,40 @@ class CppClassScope(CppLanguageElement):
         if self.scope is not None:
             cpp.label(self.scope)
 
-        if self.documentation:
-            cpp(dedent(self.documentation))
+        if self._documentation_dedented is not None:
+            cpp(self._documentation_dedented)
 
         self.render_enum_declaration(cpp)
-        self.render_internal_classes_declaration(cpp)
-        self.render_methods_declaration(cpp)
-        self.render_variables_declaration(cpp)
-        self.render_array_declaration(cpp)
-        self.render_internal_scopes_declarations(cpp)
+        # all the other members are declared the same way, so in a single pass
+        for item in chain(
+            self.internal_class_elements,
+            self.methods,
+            self.variable_members,
+            self.array_members,
+            self.internal_scopes,
+        ):
+            item.render_to_string_declaration(cpp)
         self.render_postfix_lines(cpp)
 
+    # members selected at rendering, as their flags may change after they are added
+    def static_variable_members(self):
+        """
+        @return: static class member variables
+        """
+        return [
+            variable for variable in self.variable_members if variable.type.is_static
+        ]
+
+    def defined_methods(self):
+        """
+        @return: class methods with implementation, i.e. not pure virtual
+        """
+        return [
+            method
+            for method in self.methods
+            if not getattr(method, "is_pure_virtual", False)
+        ]
+
     # render implementation
     def render_static_members_implementation(self, cpp):
         """
@@ -191,33 +223,40 @@ class CppClassScope(CppLanguageElement):
         int MyClass::my_static_array[] = {}
         """
         # generate definition for static variables
-        static_vars = [
-            variable for variable in self.variable_members if variable.type.is_static
-        ]
+        static_vars = self.static_variable_members()
+        if not (static_vars or self.array_members):
+            return
 
-        for var_item in static_vars:
-            var_item.definition().render_to_string(cpp)
+        with cpp.batch():
+            for var_item in static_vars:
+                var_item.render_to_string_implementation(cpp)
 
-        if static_vars and self.array_members:
-            cpp.newline()
+            if static_vars and self.array_members:
+                cpp.newline()
 
-        for arr_item in self.array_members:
-            arr_item.definition().render_to_string(cpp)
+            for arr_item in self.array_members:
+                arr_item.render_to_string_implementation(cpp)
 
-        if static_vars or self.array_members:
-            cpp.newline()
+            if static_vars or self.array_members:
+                cpp.newline()
 
     def render_methods_implementation(self, cpp):
         # generate methods implementation section
-        for func_item in self.methods:
-            if not func_item.is_pure_virtual:
+        defined_methods = self.defined_methods()
+        if not defined_methods:
+            return
+        with cpp.batch():
+            for func_item in defined_methods:
                 func_item.render_to_string_implementation(cpp)
                 cpp.newline()
 
     def render_internal_classes_implementation(self, cpp):
         # do the same for nested classes
-        for class_item in self.internal_class_elements:
-            class_item.render_to_string_implementation(cpp)
+        if not self.internal_class_elements:
+            return
+        with cpp.batch():
+            for class_item in self.internal_class_elements:
+                class_item.render_to_string_implementation(cpp)
 
     def render_internal_scopes_implementation(self, cpp):
         # do the same for nested classes
@@ -240,5 +279,7 @@ class CppClassScope(CppLanguageElement):
         A rare case enough, because the only code generator handle is used.
         Typically class declaration is rendered to *.h file, and definition to *.cpp
         """
-        self.render_to_string_declaration(cpp)
-        self.render_to_string_implementation(cpp)
+        # both sections are written at once
+        with cpp.batch():
+            self.render_to_string_declaration(cpp)
+            self.render_to_string_implementation(cpp)
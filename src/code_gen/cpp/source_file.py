@@ -9,6 +9,8 @@ class CppSourceFile(SourceFile):
     This class extends SourceFile class with some specific C++ constructions
     """
 
+    __slots__ = ()
+
     default_formatter = CodeFormat.ANSI_CPP
 
     def __init__(self, filename, formatter=None, writer=None):
@@ -24,4 +26,4 @@ class CppSourceFile(SourceFile):
         private:
         a:
         """
-        self.write(f"{text}:")
+        self.write(text + ":")
@@ -1,7 +1,64 @@
-from textwrap import dedent
+import sys
 
 from .language_element import CppLanguageElement
 
+# type modifiers packed as bit flags
+_F_STATIC = 1
+_F_EXTERN = 2
+_F_CONST = 4
+_F_CONSTEXPR = 8
+_F_REF = 16
+_F_INTEGRAL = 32
+# flags affecting the type declarator
+_F_DECLARATOR = _F_STATIC | _F_EXTERN | _F_CONST | _F_CONSTEXPR | _F_REF
+
+# declarator keywords indexed by the respective boolean flag
+_STATIC = ("", sys.intern("static"))
+_EXTERN = ("", sys.intern("extern"))
+_CONST = ("", sys.intern("const"))
+_CONSTEXPR = ("", sys.intern("constexpr"))
+_REF = ("", sys.intern("&"))
+
+
+def _declarator_affixes(flags):
+    """
+    @param: flags - combination of _F_* modifier flags
+    @return: prefix and suffix of the type name in the type declarator with the given modifiers,
+    e.g. ('static const ', '&')
+    """
+    modifiers = [
+        _STATIC[bool(flags & _F_STATIC)],
+        _EXTERN[bool(flags & _F_EXTERN)],
+        _CONST[bool(flags & _F_CONST)],
+        _CONSTEXPR[bool(flags & _F_CONSTEXPR)],
+    ]
+    prefix = "".join(f"{m} " for m in modifiers if m)
+    return sys.intern(prefix), _REF[bool(flags & _F_REF)]
+
+
+# declarator affixes for all combinations of the declarator flags
+_DECLARATORS = tuple(_declarator_affixes(flags) for flags in range(_F_DECLARATOR + 1))
+
+
+def _flag_property(flag):
+    """
+    Boolean property stored as a bit in '_flags' attribute,
+    setting it resets the cached scoped names
+    """
+
+    def getter(self):
+        return bool(self._flags & flag)
+
+    def setter(self, value):
+        if value:
+            self._flags |= flag
+        else:
+            self._flags &= ~flag
+        cache = self._scoped_name_cache
+        cache[0] = cache[1] = None
+
+    return property(getter, setter)
+
 
 # noinspection PyUnresolvedReferences
 class CppBaseType(CppLanguageElement):
@@ -10,6 +67,12 @@ class CppBaseType(CppLanguageElement):
         array, variable, template type
     """
 
+    __slots__ = (
+        "_type",
+        "_flags",
+        "_scoped_name_cache",
+    )
+
     PROPERTIES = CppLanguageElement.PROPERTIES | {
         "type",
         "is_static",
@@ -21,7 +84,16 @@ class CppBaseType(CppLanguageElement):
         "documentation",
     }
 
+    is_static = _flag_property(_F_STATIC)
+    is_extern = _flag_property(_F_EXTERN)
+    is_const = _flag_property(_F_CONST)
+    is_constexpr = _flag_property(_F_CONSTEXPR)
+    is_ref = _flag_property(_F_REF)
+    is_integral = _flag_property(_F_INTEGRAL)
+
     def __init__(self, **properties):
+        self._scoped_name_cache = [None, None]
+        self._flags = 0
         super().__init__()
         self.type = None
         self.is_static = False
@@ -32,6 +104,9 @@ class CppBaseType(CppLanguageElement):
         self.is_integral = False
         self.documentation = None
         self.init_properties(properties)
+        # invalid modifiers are reported on construction, and checked again on
+        # rendering only if the type changes in between (see scoped_name)
+        self._sanity_check()
 
     @staticmethod
     def normalize(ctype, **properties):
@@ -40,73 +115,67 @@ class CppBaseType(CppLanguageElement):
             return CppBaseType(type=ctype, **properties)
         return ctype
 
+    @property
+    def type(self):
+        return self._type
+
+    @type.setter
+    def type(self, value):
+        self._type = value
+        cache = self._scoped_name_cache
+        cache[0] = cache[1] = None
+
     def scoped_name(self, local_scope):
+        """
+        The result is cached for both local_scope values until the type or any of
+        its modifiers changes. Only a plain string type is cached, a wrapped element
+        (e.g. a template type) may change without notice, so it is resolved on every call.
+        """
+        cached = self._scoped_name_cache[local_scope]
+        if cached is not None:
+            return cached
         self._sanity_check()
         s_name = CppLanguageElement.resolved_name(self.type, local_scope)
-        declarators = [
-            f"{self._static()}",
-            f"{self._extern()}",
-            f"{self._const()}",
-            f"{self._constexpr()}",
-            f"{s_name}{self._ref()}",
-        ]
-        return " ".join(d for d in declarators if d)
+        prefix, suffix = _DECLARATORS[self._flags & _F_DECLARATOR]
+        result = prefix + s_name + suffix
+        if isinstance(self.type, str):
+            self._scoped_name_cache[local_scope] = result
+        return result
 
     def _sanity_check(self):
         """
         @raise: ValueError, if some properties are not valid
         """
-        if self.is_const and self.is_constexpr:
+        flags = self._flags
+        if (flags & (_F_CONST | _F_CONSTEXPR)) == (_F_CONST | _F_CONSTEXPR):
             raise ValueError(
                 "Type object can be either 'const' or 'constexpr', not both"
             )
-        if self.is_static and self.is_extern:
+        if (flags & (_F_STATIC | _F_EXTERN)) == (_F_STATIC | _F_EXTERN):
             raise ValueError("Type object can be either 'extern' or 'static', not both")
 
-    def _static(self):
-        """
-        @return: 'static' prefix, can't be used with 'extern'
-        """
-        return "static" if self.is_static else ""
-
-    def _extern(self):
-        """
-        @return: 'extern' prefix, can't be used with 'static'
-        """
-        return "extern" if self.is_extern else ""
-
-    def _const(self):
-        """
-        @return: 'const' prefix, can't be used with 'constexpr'
-        """
-        return "const" if self.is_const else ""
-
-    def _constexpr(self):
-        """
-        @return: 'constexpr' prefix, can't be used with 'const'
-        """
-        return "constexpr" if self.is_constexpr else ""
-
-    def _ref(self):
-        return "&" if self.is_ref else ""
-
 
 class CppTemplateType(CppBaseType):
     """Implements an abstraction of a C++ templated type."""
 
+    __slots__ = ("template_args",)
+
     PROPERTIES = CppBaseType.PROPERTIES | {
         "template_args",
     }
 
     def __init__(self, **properties):
-        super().__init__()
         self.template_args = []
-        self.init_properties(properties)
+        super().__init__(**properties)
 
     def scoped_name(self, local_scope):
+        """
+        The result is not cached, as template arguments may be changed in place
+        """
         self._sanity_check()
-        s_name = super().resolved_name(self.type, local_scope)
-        t_args_names = []
-        for t_arg in self.template_args:
-            t_args_names.append(CppLanguageElement.resolved_name(t_arg, local_scope))
-        return f'{s_name}<{", ".join(t_args_names)}>'
+        resolved_name = CppLanguageElement.resolved_name
+        s_name = resolved_name(self.type, local_scope)
+        t_args = ", ".join(
+            [resolved_name(t_arg, local_scope) for t_arg in self.template_args]
+        )
+        return f"{s_name}<{t_args}>"
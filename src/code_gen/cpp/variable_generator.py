@@ -1,5 +1,3 @@
-from textwrap import dedent
-
 from .language_element import CppLanguageElement
 from .type_base_generator import CppBaseType
 
@@ -79,6 +77,8 @@ class CppVariable(CppLanguageElement):
     documentation - string, '/// Example doxygen'
     """
 
+    __slots__ = ("type", "value")
+
     PROPERTIES = CppLanguageElement.PROPERTIES | {
         "value",
         "documentation",
@@ -94,17 +94,27 @@ class CppVariable(CppLanguageElement):
     def _declaration(self, local_scope):
         return f"{self.type.scoped_name(local_scope)} {self.scoped_name(local_scope)}"
 
-    def _assignment(self, value, local_scope):
-        """
-        Generates assignment statement for the variable, e.g.
-        a = 10;
-        b = 20;
-        """
-        return f"{self._declaration(local_scope)} = {value}"
-
     def set_value(self, value):
         self.value = value
 
+    def emit(self):
+        """
+        Generates lines of the complete variable definition (see render_to_string)
+        @return: list of lines without indentation and line endings
+        """
+        self._sanity_check()
+        var_type = self.type
+        if self.is_class_member() and not (var_type.is_static and var_type.is_const):
+            raise RuntimeError(
+                "For class member variables use definition() and declaration() methods"
+            )
+        declaration = self._declaration(local_scope=True)
+        if var_type.is_extern:
+            return [f"{declaration};"]
+        if self._documentation_dedented is not None:
+            return [self._documentation_dedented, f"{declaration} = {self.value};"]
+        return [f"{declaration} = {self.value};"]
+
     def render_to_string(self, cpp):
         """
         Only automatic variables or static const class members could be rendered using this method
@@ -112,17 +122,7 @@ class CppVariable(CppLanguageElement):
         int a = 10;
         const double b = M_PI;
         """
-        self._sanity_check()
-        if self.is_class_member() and not (self.type.is_static and self.type.is_const):
-            raise RuntimeError(
-                "For class member variables use definition() and declaration() methods"
-            )
-        if self.type.is_extern:
-            cpp(f"{self._declaration(local_scope=True)};")
-        else:
-            if self.documentation:
-                cpp(dedent(self.documentation))
-            cpp(f"{self._assignment(self.value, local_scope=True)};")
+        cpp.writelines(self.emit())
 
     def render_to_string_declaration(self, cpp):
         """
@@ -134,14 +134,19 @@ class CppVariable(CppLanguageElement):
                 "For automatic variable use its render_to_string() method"
             )
 
-        if self.documentation and self.is_class_member():
-            cpp(dedent(self.documentation))
-        if self.type.is_constexpr:
-            cpp(f"{self._assignment(self.value, local_scope=True)};")
-        elif self.value and not self.type.is_static:
-            cpp(f"{self._declaration(local_scope=True)}{{{self._init_value()}}};")
+        var_type = self.type
+        declaration = self._declaration(local_scope=True)
+        if var_type.is_constexpr:
+            line = f"{declaration} = {self.value};"
+        elif self.value and not var_type.is_static:
+            line = f"{declaration}{{{self.value}}};"
+        else:
+            line = f"{declaration};"
+        # documentation and declaration are written at once
+        if self._documentation_dedented is not None:
+            cpp.writelines([self._documentation_dedented, line])
         else:
-            cpp(f"{self._declaration(local_scope=True)};")
+            cpp(line)
 
     def render_to_string_implementation(self, cpp):
         """
@@ -161,19 +166,20 @@ class CppVariable(CppLanguageElement):
                 "For automatic variable use its render_to_string() method"
             )
 
-        # generate definition for the static class member
-        if not self.type.is_constexpr:
-            if self.type.is_static:
-                cpp(f"{self._assignment(self.value, local_scope=False)};")
-            # generate definition for non-static static class member, e.g. m_var(0)
-            # (string for the constructor initialization list)
-            else:
-                cpp(f"{self.scoped_name(local_scope=True)}({self._init_value()});")
-        else:
+        var_type = self.type
+        if var_type.is_constexpr:
             raise ValueError(
                 f"Cannot generate implementation for 'constexpr' variable {self.name}"
             )
 
+        # generate definition for the static class member
+        if var_type.is_static:
+            cpp(f"{self._declaration(local_scope=False)} = {self.value};")
+        # generate definition for non-static static class member, e.g. m_var(0)
+        # (string for the constructor initialization list)
+        else:
+            cpp(f"{self.name}({self._init_value()});")
+
     def _sanity_check(self):
         """
         @raise: ValueError, if some properties are not valid
@@ -181,30 +187,6 @@ class CppVariable(CppLanguageElement):
         if self.type.is_constexpr and not self.value:
             raise ValueError("Variable object must be initialized when 'constexpr'")
 
-    def _static(self):
-        """
-        @return: 'static' prefix, can't be used with 'extern'
-        """
-        return "static" if self.is_static else ""
-
-    def _extern(self):
-        """
-        @return: 'extern' prefix, can't be used with 'static'
-        """
-        return "extern" if self.is_extern else ""
-
-    def _const(self):
-        """
-        @return: 'const' prefix, can't be used with 'constexpr'
-        """
-        return "const" if self.is_const else ""
-
-    def _constexpr(self):
-        """
-        @return: 'constexpr' prefix, can't be used with 'const'
-        """
-        return "constexpr" if self.is_constexpr else ""
-
     def _init_value(self):
         """
         @return: string, value to be initialized with
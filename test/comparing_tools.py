@@ -1,29 +1,46 @@
-from collections import OrderedDict
+from functools import lru_cache
 
+# (old, new) pairs applied in order until the code does not change anymore
+_REPLACEMENTS = (
+    ("\r\n", "\n"),
+    ("\r\n\r\n", "\n"),
+    ("\r\r", "\n"),
+    ("\t\n", "\n"),
+    ("\n\n", "\n"),
+    ("\t", "    "),
+    ("\r", "\n"),
+)
 
+
+@lru_cache(maxsize=1024)
 def normalize_code(code):
     """
     Normalize indentation, whitespace and line breaks for comparison
+    The result is cached, as the same expected code is normalized repeatedly
     """
-
-    replacements = OrderedDict()
-    replacements["\r\n"] = "\n"
-    replacements["\r\n\r\n"] = "\n"
-    replacements["\r\r"] = "\n"
-    replacements["\t\n"] = "\n"
-    replacements["\n\n"] = "\n"
-    replacements["\t"] = "    "
-    replacements["\r"] = "\n"
-
     count = 1
     while count > 0:
-        for old, new in replacements.items():
+        for old, new in _REPLACEMENTS:
             count = code.count(old)
             code = code.replace(old, new)
 
     return code
 
 
+def assert_code_equal(test_case, expected, actual, extension="cpp"):
+    """
+    Assert the generated code matches the expected one,
+    the code is normalized (and dumped in debug mode) only if it differs
+    """
+    if expected == actual:
+        return
+    expected_normalized = normalize_code(expected)
+    actual_normalized = normalize_code(actual)
+    if is_debug():
+        debug_dump(expected_normalized, actual_normalized, extension)
+    test_case.assertEqual(expected_normalized, actual_normalized)
+
+
 def debug_dump(expected, actual, extension):
     """
     Dump the actual and expected values to 2 files
@@ -23,6 +23,15 @@ class TestCppArrayStringIo(unittest.TestCase):
         expected_output = "int my_array[5] = {1, 2, 0};"
         self.assertEqual(expected_output, writer.getvalue().strip())
 
+    def test_numeric_items(self):
+        writer = io.StringIO()
+        cpp = CppSourceFile(None, writer=writer)
+        arr = CppArray(name="my_array", type="double", array_size=3)
+        arr.add_array_items([1, 2.5, -3])
+        arr.render_to_string(cpp)
+        expected_output = "double my_array[3] = {1, 2.5, -3};"
+        self.assertEqual(expected_output, writer.getvalue().strip())
+
     def test_with_newline_align(self):
         writer = io.StringIO()
         cpp = CppSourceFile(None, writer=writer)
@@ -2,8 +2,15 @@ import unittest
 import io
 from textwrap import dedent
 
-from code_gen.cpp import CppSourceFile, CppEnum, CppArray, CppVariable, CppClass
-from test.comparing_tools import normalize_code, debug_dump, is_debug
+from code_gen.cpp import (
+    CppSourceFile,
+    CppEnum,
+    CppArray,
+    CppVariable,
+    CppClass,
+    CppTemplateType,
+)
+from test.comparing_tools import assert_code_equal
 
 __doc__ = """Unit tests for C++ code generator"""
 
@@ -80,11 +87,7 @@ class TestCppClassStringIo(unittest.TestCase):
 
         # Assert the output matches the expected output
         actual_output = writer.getvalue().strip()
-        expected_output_normalized = normalize_code(expected_output)
-        actual_output_normalized = normalize_code(actual_output)
-        if is_debug():
-            debug_dump(expected_output_normalized, actual_output_normalized, "cpp")
-        self.assertEqual(expected_output_normalized, actual_output_normalized)
+        assert_code_equal(self, expected_output, actual_output)
 
     def test_with_inheritance(self):
         writer = io.StringIO()
@@ -144,12 +147,7 @@ class TestCppClassStringIo(unittest.TestCase):
 
         # Assert the output matches the expected output
         actual_output = writer.getvalue().strip()
-        expected_output_normalized = normalize_code(expected_output)
-        actual_output_normalized = normalize_code(actual_output)
-        if is_debug():
-            debug_dump(expected_output_normalized, actual_output_normalized, "cpp")
-
-        self.assertEqual(expected_output_normalized, actual_output_normalized)
+        assert_code_equal(self, expected_output, actual_output)
 
     def test_with_nested_classes(self):
         writer = io.StringIO()
@@ -180,11 +178,7 @@ class TestCppClassStringIo(unittest.TestCase):
         )
 
         actual_output = writer.getvalue().strip()
-        expected_output_normalized = normalize_code(expected_output)
-        actual_output_normalized = normalize_code(actual_output)
-        if is_debug():
-            debug_dump(expected_output_normalized, actual_output_normalized, "cpp")
-        self.assertEqual(expected_output_normalized, actual_output_normalized)
+        assert_code_equal(self, expected_output, actual_output)
 
     def test_with_enum(self):
         writer = io.StringIO()
@@ -222,11 +216,7 @@ class TestCppClassStringIo(unittest.TestCase):
 
         # Assert the output matches the expected output
         actual_output = writer.getvalue().strip()
-        expected_output_normalized = normalize_code(expected_output)
-        actual_output_normalized = normalize_code(actual_output)
-        if is_debug():
-            debug_dump(expected_output_normalized, actual_output_normalized, "cpp")
-        self.assertEqual(expected_output_normalized, actual_output_normalized)
+        assert_code_equal(self, expected_output, actual_output)
 
     def test_with_array(self):
         writer = io.StringIO()
@@ -258,11 +248,232 @@ class TestCppClassStringIo(unittest.TestCase):
 
         # Assert the output matches the expected output
         actual_output = writer.getvalue().strip()
-        expected_output_normalized = normalize_code(expected_output)
-        actual_output_normalized = normalize_code(actual_output)
-        if is_debug():
-            debug_dump(expected_output_normalized, actual_output_normalized, "cpp")
-        self.assertEqual(expected_output_normalized, actual_output_normalized)
+        assert_code_equal(self, expected_output, actual_output)
+
+    def test_qualified_name_after_reparenting(self):
+        # Create a nested class with a static member
+        nested_class = CppClass(name="NestedClass")
+        variable = CppVariable(name="m_var", type="int", is_static=True, value="0")
+        nested_class.add_variable(variable)
+        self.assertEqual("NestedClass::m_var", variable.fully_qualified_name())
+
+        # Qualifier must follow the later changes of the parent chain
+        cpp_class = CppClass(name="MyClass")
+        cpp_class.add_internal_class(nested_class)
+        self.assertEqual("MyClass::NestedClass::m_var", variable.fully_qualified_name())
+
+        nested_class.name = "Renamed"
+        self.assertEqual("MyClass::Renamed::m_var", variable.fully_qualified_name())
+
+    def test_method_headers_after_changes(self):
+        cpp_class = CppClass(name="MyClass")
+        method = CppClass.CppMethod(
+            name="GetVar", ret_type="int", implementation=lambda cpp: None
+        )
+        cpp_class.add_method(method)
+        self.assertEqual("int GetVar()", method.short_header_declaration_to_string())
+        self.assertEqual(
+            "int MyClass::GetVar()", method.full_header_implementation_to_string()
+        )
+
+        # Headers must follow the later changes of the method and its parent
+        method.add_argument("int a")
+        method.is_const = True
+        cpp_class.name = "Renamed"
+        self.assertEqual(
+            "int GetVar(int a) const", method.short_header_declaration_to_string()
+        )
+        self.assertEqual(
+            "int Renamed::GetVar(int a) const",
+            method.full_header_implementation_to_string(),
+        )
+
+    def test_method_arguments_replaced_after_render(self):
+        cpp_class = CppClass(name="MyClass")
+        method = CppClass.CppMethod(
+            name="SetVar", ret_type="void", implementation=lambda cpp: None
+        )
+        method.add_argument("int a")
+        cpp_class.add_method(method)
+        self.assertEqual(
+            "void SetVar(int a)", method.short_header_declaration_to_string()
+        )
+
+        # Headers must follow the in-place changes of the arguments
+        method.arguments[0] = "int b"
+        self.assertEqual(
+            "void SetVar(int b)", method.short_header_declaration_to_string()
+        )
+        self.assertEqual(
+            "void MyClass::SetVar(int b)",
+            method.full_header_implementation_to_string(),
+        )
+
+    def test_method_template_type_changed_after_render(self):
+        cpp_class = CppClass(name="MyClass")
+        ret_type = CppTemplateType(type="std::vector", template_args=["int"])
+        method = CppClass.CppMethod(
+            name="GetVar", ret_type=ret_type, implementation=lambda cpp: None
+        )
+        cpp_class.add_method(method)
+        self.assertEqual(
+            "std::vector<int> GetVar()", method.short_header_declaration_to_string()
+        )
+
+        # Headers must follow the later changes of the template arguments
+        ret_type.template_args[0] = "char"
+        self.assertEqual(
+            "std::vector<char> GetVar()", method.short_header_declaration_to_string()
+        )
+
+    def test_nested_static_members_rendered_once(self):
+        writer = io.StringIO()
+        cpp = CppSourceFile(None, writer=writer)
+        cpp_class = CppClass(name="MyClass")
+        nested_class = CppClass(name="NestedClass")
+        nested_class.add_variable(
+            CppVariable(name="m_var", type="int", is_static=True, value="0")
+        )
+        cpp_class.add_internal_class(nested_class)
+        cpp_class.render_to_string_implementation(cpp)
+        self.assertEqual(
+            1, writer.getvalue().count("static int MyClass::NestedClass::m_var = 0;")
+        )
+
+    def test_method_checked_again_after_change(self):
+        writer = io.StringIO()
+        cpp = CppSourceFile(None, writer=writer)
+        cpp_class = CppClass(name="MyClass")
+        method = CppClass.CppMethod(name="GetVar", ret_type="int", is_const=True)
+        cpp_class.add_method(method)
+        method.render_to_string_declaration(cpp)
+
+        # The method passed the check once, but is not valid anymore
+        method.is_static = True
+        self.assertRaises(ValueError, method.render_to_string_declaration, cpp)
+
+    def test_inline_virtual_method_raises(self):
+        cpp_class = CppClass(name="MyClass")
+        for flag in ("is_virtual", "is_pure_virtual"):
+            method = CppClass.CppMethod(name="Method", is_inline=True, **{flag: True})
+            cpp_class.add_method(method)
+            with self.assertRaisesRegex(ValueError, "could not be virtual"):
+                method.render_to_string_declaration(None)
+
+    def test_declaration_after_changes(self):
+        cpp_class = CppClass(name="MyClass")
+        writer = io.StringIO()
+        cpp_class.render_to_string_declaration(CppSourceFile(None, writer=writer))
+        self.assertEqual("class MyClass\n{\n};\n", writer.getvalue())
+
+        # Header must follow the later changes of the class
+        cpp_class.name = "Derived"
+        cpp_class.is_struct = True
+        cpp_class.parent_class = "Base"
+        writer = io.StringIO()
+        cpp_class.render_to_string_declaration(CppSourceFile(None, writer=writer))
+        self.assertEqual("struct Derived : public Base\n{\n};\n", writer.getvalue())
+
+    def test_flags_changed_after_adding(self):
+        cpp_class = CppClass(name="MyClass")
+        variable = CppVariable(name="m_var", type="int", value="0")
+        method = CppClass.CppMethod(
+            name="Method", is_virtual=True, implementation=lambda cpp: None
+        )
+        cpp_class.add_variable(variable)
+        cpp_class.add_method(method)
+
+        # members are selected for the implementation when it is rendered
+        variable.type.is_static = True
+        method.is_pure_virtual = True
+        method.implementation = None
+        writer = io.StringIO()
+        cpp_class.render_to_string_implementation(CppSourceFile(None, writer=writer))
+        self.assertEqual("static int MyClass::m_var = 0;\n\n", writer.getvalue())
+
+    def test_render_to_files(self):
+        def make_class():
+            cpp_class = CppClass(name="MyClass", parent_class="Base")
+            cpp_class.add_variable(
+                CppVariable(name="m_var", type="int", is_static=True, value="0")
+            )
+            nested_class = CppClass(name="NestedClass")
+            nested_class.add_method(
+                CppClass.CppMethod(
+                    name="Nested",
+                    ret_type="int",
+                    implementation=lambda cpp: cpp("return 1;"),
+                )
+            )
+            cpp_class.add_internal_class(nested_class)
+            cpp_class.add_method(
+                CppClass.CppMethod(
+                    name="GetVar",
+                    ret_type="int",
+                    implementation=lambda cpp: cpp("return m_var;"),
+                )
+            )
+            cpp_class.add_method(
+                CppClass.CppMethod(
+                    name="Pure", ret_type="void", is_virtual=True, is_pure_virtual=True
+                )
+            )
+            return cpp_class
+
+        expected_header, expected_cpp = io.StringIO(), io.StringIO()
+        cpp_class = make_class()
+        cpp_class.render_to_string_declaration(
+            CppSourceFile(None, writer=expected_header)
+        )
+        cpp_class.render_to_string_implementation(
+            CppSourceFile(None, writer=expected_cpp)
+        )
+
+        header, cpp = io.StringIO(), io.StringIO()
+        make_class().render_to_files(
+            CppSourceFile(None, writer=header), CppSourceFile(None, writer=cpp)
+        )
+        self.assertEqual(expected_header.getvalue(), header.getvalue())
+        self.assertEqual(expected_cpp.getvalue(), cpp.getvalue())
+
+    def test_render_to_files_checks_declaration_first(self):
+        cpp_class = CppClass(name="MyClass")
+        # both the declaration and the implementation are invalid
+        cpp_class.add_variable(
+            CppVariable(name="m_var", type="int", is_static=True, is_constexpr=True)
+        )
+        cpp_class.add_method(
+            CppClass.CppMethod(name="Method", is_static=True, is_const=True)
+        )
+        with self.assertRaisesRegex(ValueError, "could not be const"):
+            cpp_class.render_to_files(
+                CppSourceFile(None, writer=io.StringIO()),
+                CppSourceFile(None, writer=io.StringIO()),
+            )
+
+    def test_implementation_written_at_once(self):
+        class CountingWriter(io.StringIO):
+            writes = 0
+
+            def write(self, text):
+                self.writes += 1
+                return super().write(text)
+
+        cpp_class = CppClass(name="MyClass")
+        cpp_class.add_variable(
+            CppVariable(name="m_var", type="int", is_static=True, value="0")
+        )
+        cpp_class.add_method(
+            CppClass.CppMethod(
+                name="GetVar",
+                ret_type="int",
+                implementation=lambda cpp: cpp("return m_var;"),
+            )
+        )
+        writer = CountingWriter()
+        cpp_class.render_to_string_implementation(CppSourceFile(None, writer=writer))
+        self.assertIn("int MyClass::GetVar()", writer.getvalue())
+        self.assertEqual(1, writer.writes)
 
 
 if __name__ == "__main__":
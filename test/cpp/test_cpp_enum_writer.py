@@ -3,7 +3,7 @@ import io
 from textwrap import dedent
 
 from code_gen.cpp import CppSourceFile, CppEnum
-from test.comparing_tools import normalize_code, debug_dump, is_debug
+from test.comparing_tools import assert_code_equal
 
 __doc__ = """Unit tests for C++ code generator
 """
@@ -30,12 +30,7 @@ class TestCppEnumStringIo(unittest.TestCase):
             };"""
         )
         actual_output = writer.getvalue().strip()
-        expected_output_normalized = normalize_code(expected_output)
-        actual_output_normalized = normalize_code(actual_output)
-        if is_debug():
-            debug_dump(expected_output_normalized, actual_output_normalized, "cpp")
-
-        self.assertEqual(expected_output_normalized, actual_output_normalized)
+        assert_code_equal(self, expected_output, actual_output)
 
     def test_with_prefix(self):
         writer = io.StringIO()
@@ -53,12 +48,7 @@ class TestCppEnumStringIo(unittest.TestCase):
             };"""
         )
         actual_output = writer.getvalue().strip()
-        expected_output_normalized = normalize_code(expected_output)
-        actual_output_normalized = normalize_code(actual_output)
-        if is_debug():
-            debug_dump(expected_output_normalized, actual_output_normalized, "cpp")
-
-        self.assertEqual(expected_output_normalized, actual_output_normalized)
+        assert_code_equal(self, expected_output, actual_output)
 
     def test_class(self):
         writer = io.StringIO()
@@ -76,12 +66,7 @@ class TestCppEnumStringIo(unittest.TestCase):
             };"""
         )
         actual_output = writer.getvalue().strip()
-        expected_output_normalized = normalize_code(expected_output)
-        actual_output_normalized = normalize_code(actual_output)
-        if is_debug():
-            debug_dump(expected_output_normalized, actual_output_normalized, "cpp")
-
-        self.assertEqual(expected_output_normalized, actual_output_normalized)
+        assert_code_equal(self, expected_output, actual_output)
 
 
 if __name__ == "__main__":
@@ -236,6 +236,20 @@ class TestCppFileIo(unittest.TestCase):
         if os.path.exists("var.cpp"):
             os.remove("var.cpp")
 
+    def test_file_output(self):
+        """
+        Test the output is a regular file object
+        """
+        cpp = CppSourceFile("out.cpp")
+        cpp("int a = 0;")
+        self.assertEqual("out.cpp", cpp.out.name)
+        cpp.out.flush()
+        with open("out.cpp") as out:
+            self.assertEqual("int a = 0;\n", out.read())
+        cpp.close()
+        if os.path.exists("out.cpp"):
+            os.remove("out.cpp")
+
 
 if __name__ == "__main__":
     unittest.main()
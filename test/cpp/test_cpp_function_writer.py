@@ -107,6 +107,48 @@ class TestCppFunctionStringIo(unittest.TestCase):
             writer.getvalue(),
         )
 
+    def test_indented_documentation(self):
+        writer = io.StringIO()
+        cpp = CppSourceFile(None, writer=writer)
+        factorial_function = CppFunction(
+            name="factorial",
+            ret_type="int",
+            is_constexpr=True,
+            implementation=handle_to_factorial,
+            documentation="""
+                /// Calculates and returns
+                /// the factorial of p @n.""",
+        )
+        factorial_function.add_argument("int n")
+        factorial_function.render_to_string_declaration(cpp)
+        self.assertIn(
+            dedent(
+                """\
+            /// Calculates and returns
+            /// the factorial of p @n.
+            constexpr int factorial(int n) {"""
+            ),
+            writer.getvalue(),
+        )
+
+    def test_arguments_changed_after_render(self):
+        writer = io.StringIO()
+        cpp = CppSourceFile(None, writer=writer)
+        func = CppFunction(name="g", ret_type="void")
+        func.add_argument("int a")
+        func.render_to_string_declaration(cpp)
+
+        # Declaration must follow the later changes of the arguments
+        func.arguments[0] = "int b"
+        func.render_to_string_declaration(cpp)
+        self.assertEqual("void g(int a);\nvoid g(int b);\n", writer.getvalue())
+
+    def test_empty_return_type(self):
+        func = CppFunction(name="f", ret_type="")
+        self.assertEqual("f()", func.short_header_declaration_to_string())
+        func.is_constexpr = True
+        self.assertEqual("constexpr f()", func.short_header_declaration_to_string())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,4 @@
 import unittest
-import io
-from textwrap import dedent
 
 from code_gen.cpp import (
     CppSourceFile,
@@ -8,20 +6,53 @@ from code_gen.cpp import (
     CppClassScope,
     CppClass,
 )
-from test.comparing_tools import normalize_code, debug_dump, is_debug
+from test.comparing_tools import assert_code_equal
 
 __doc__ = """Unit tests for C++ code generator"""
 
+# expected outputs, the adjacent literals are joined at compile time
+_EXPECTED_SIMPLE = (
+    "private:\n"
+    "    static size_t GetVar();\n"
+    "    static const size_t m_var;\n"
+    "\n"
+    "    static const size_t m_var = 255;\n"
+    "\n"
+    "    size_t GetVar()\n"
+    "    {\n"
+    "        return m_var;\n"
+    "    }"
+)
+
+_EXPECTED_NESTED_SCOPES = (
+    "class MyClass\n"
+    "{\n"
+    "private:\n"
+    "    class NestedClass\n"
+    "    {\n"
+    "    };\n"
+    "};"
+)
+
+_EXPECTED_POSTFIX_LINES = (
+    "struct MyClass\n"
+    "{\n"
+    "    int m_var;\n"
+    "    // first postfix line\n"
+    "    // second postfix line\n"
+    "};\n"
+)
+
 
 class TestCppScopeStringIo(unittest.TestCase):
     """
-    Test C++ class generation by writing to StringIO
+    Test C++ class generation by writing to memory
     """
 
-    def test_simple_case(self):
-        writer = io.StringIO()
-        cpp_file = CppSourceFile(None, writer=writer)
+    def setUp(self):
+        self.cpp = CppSourceFile(None)
 
+    def test_simple_case(self):
         # Create a CppClass instance
         cpp_scope = CppClassScope(scope="private")
 
@@ -44,36 +75,17 @@ class TestCppScopeStringIo(unittest.TestCase):
         )
 
         # Render the class to string
-        with cpp_file.block(postfix="", braces=False) as block:
+        with self.cpp.block(postfix="", braces=False) as block:
             cpp_scope.render_to_string(block)
 
         # Define the expected output
-        expected_output = dedent(
-            """\
-            private:
-                static size_t GetVar();
-                static const size_t m_var;
-
-                static const size_t m_var = 255;
-
-                size_t GetVar()
-                {
-                    return m_var;
-                }"""
-        )
+        expected_output = _EXPECTED_SIMPLE
 
         # Assert the output matches the expected output
-        actual_output = writer.getvalue().strip()
-        expected_output_normalized = normalize_code(expected_output)
-        actual_output_normalized = normalize_code(actual_output)
-        if is_debug():
-            debug_dump(expected_output_normalized, actual_output_normalized, "cpp")
-        self.assertEqual(expected_output_normalized, actual_output_normalized)
+        actual_output = self.cpp.getvalue().strip()
+        assert_code_equal(self, expected_output, actual_output)
 
     def test_with_nested_scopes(self):
-        writer = io.StringIO()
-        cpp = CppSourceFile(None, writer=writer)
-
         # Create a CppClass instance
         cpp_class = CppClass(name="MyClass")
 
@@ -88,26 +100,28 @@ class TestCppScopeStringIo(unittest.TestCase):
         cpp_class.add_internal_scope(nested_scope)
 
         # Render the main class to string
-        cpp_class.render_to_string(cpp)
+        cpp_class.render_to_string(self.cpp)
 
         # Define the expected output
-        expected_output = dedent(
-            """\
-            class MyClass
-            {
-            private:
-                class NestedClass
-                {
-                };
-            };"""
-        )
+        expected_output = _EXPECTED_NESTED_SCOPES
+
+        actual_output = self.cpp.getvalue().strip()
+        assert_code_equal(self, expected_output, actual_output)
+
+    def test_postfix_lines(self):
+        # Create a CppClass instance with postfix lines
+        cpp_class = CppClass(name="MyClass", is_struct=True)
+        cpp_class.add_variable(CppVariable(name="m_var", type="int"))
+        cpp_class.add_postfix_line("// first postfix line")
+        cpp_class.add_postfix_line("// second postfix line")
+
+        # Render the class declaration to string
+        cpp_class.render_to_string_declaration(self.cpp)
+
+        # Define the expected output
+        expected_output = _EXPECTED_POSTFIX_LINES
 
-        actual_output = writer.getvalue().strip()
-        expected_output_normalized = normalize_code(expected_output)
-        actual_output_normalized = normalize_code(actual_output)
-        if is_debug():
-            debug_dump(expected_output_normalized, actual_output_normalized, "cpp")
-        self.assertEqual(expected_output_normalized, actual_output_normalized)
+        self.assertEqual(expected_output, self.cpp.getvalue())
 
 
 if __name__ == "__main__":
@@ -25,18 +25,27 @@ class TestCppBaseTypeStringIo(unittest.TestCase):
         for local_scope in [True, False]:
             s = type.scoped_name(local_scope=local_scope)
             self.assertEqual("const char&", s)
+        # and the type itself
+        type.type = "short"
+        for local_scope in [True, False]:
+            s = type.scoped_name(local_scope=local_scope)
+            self.assertEqual("const short&", s)
 
     def test_is_constexpr_const_raises(self):
-        type = CppBaseType(
-            type="int",
-            const=True,
-            constexpr=True,
+        self.assertRaises(
+            ValueError, CppBaseType, type="int", const=True, constexpr=True
         )
+        type = CppBaseType(type="int", const=True)
+        type.is_constexpr = True
         for local_scope in [True, False]:
             self.assertRaises(ValueError, type.scoped_name, local_scope)
 
     def test_is_extern_static_raises(self):
-        type = CppBaseType(type="char*", static=True, extern=True)
+        self.assertRaises(
+            ValueError, CppBaseType, type="char*", static=True, extern=True
+        )
+        type = CppBaseType(type="char*", static=True)
+        type.is_extern = True
         for local_scope in [True, False]:
             self.assertRaises(ValueError, type.scoped_name, local_scope)
 
@@ -69,6 +78,16 @@ class TestCppBaseTypeStringIo(unittest.TestCase):
             s = templ1.scoped_name(local_scope)
             self.assertEqual("std::map<const char, bool>", s)
 
+    def test_args_changed_after_render(self):
+        type1 = CppBaseType(type="char", const=True)
+        templ1 = CppTemplateType(type="std::tuple", template_args=[type1])
+        self.assertEqual("std::tuple<const char>", templ1.scoped_name(True))
+
+        # Name must follow the later changes of the arguments
+        type1.is_ref = True
+        templ1.template_args.append("bool")
+        self.assertEqual("std::tuple<const char&, bool>", templ1.scoped_name(True))
+
 
 if __name__ == "__main__":
     unittest.main()
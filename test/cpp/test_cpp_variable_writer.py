@@ -1,7 +1,6 @@
 import unittest
-import io
 
-from code_gen.cpp import CppSourceFile, CppVariable, CppClass
+from code_gen.cpp import CppSourceFile, CppVariable, CppClass, CppTemplateType
 
 __doc__ = """Unit tests for C++ code generator
 """
@@ -9,12 +8,13 @@ __doc__ = """Unit tests for C++ code generator
 
 class TestCppVariableStringIo(unittest.TestCase):
     """
-    Test C++ variable generation by writing to StringIO
+    Test C++ variable generation by writing to memory
     """
 
+    def setUp(self):
+        self.cpp = CppSourceFile(None)
+
     def test_simple_case(self):
-        writer = io.StringIO()
-        cpp = CppSourceFile(None, writer=writer)
         variables = CppVariable(
             name="var1",
             type="char*",
@@ -22,60 +22,113 @@ class TestCppVariableStringIo(unittest.TestCase):
             is_const=True,
             value="0",
         )
-        variables.render_to_string(cpp)
-        self.assertEqual("const char* var1 = 0;\n", writer.getvalue())
+        variables.render_to_string(self.cpp)
+        self.assertEqual("const char* var1 = 0;\n", self.cpp.getvalue())
 
     def test_is_constexpr_const_raises(self):
-        writer = io.StringIO()
-        cpp = CppSourceFile(None, writer=writer)
-        var = CppVariable(
+        self.assertRaises(
+            ValueError,
+            CppVariable,
             name="COUNT",
             type="int",
             is_const=True,
             is_constexpr=True,
             value="0",
         )
-        self.assertRaises(ValueError, var.render_to_string, cpp)
+
+        # the combination made after construction is reported on rendering
+        var = CppVariable(name="COUNT", type="int", is_const=True, value="0")
+        var.type.is_constexpr = True
+        self.assertRaises(ValueError, var.render_to_string, self.cpp)
 
     def test_is_constexpr_no_implementation_raises(self):
-        writer = io.StringIO()
-        cpp = CppSourceFile(None, writer=writer)
         var = CppVariable(name="COUNT", type="int", is_constexpr=True)
-        self.assertRaises(ValueError, var.render_to_string, cpp)
+        self.assertRaises(ValueError, var.render_to_string, self.cpp)
 
     def test_is_constexpr_render_to_string(self):
-        writer = io.StringIO()
-        cpp = CppSourceFile(None, writer=writer)
         variable = CppVariable(
             name="COUNT",
             type="int",
             is_constexpr=True,
             value="0",
         )
-        variable.render_to_string(cpp)
-        self.assertIn("constexpr int COUNT = 0;", writer.getvalue())
+        variable.render_to_string(self.cpp)
+        self.assertIn("constexpr int COUNT = 0;", self.cpp.getvalue())
 
     def test_is_constexpr_render_to_string_declaration(self):
-        writer = io.StringIO()
-        cpp = CppSourceFile(None, writer=writer)
         cls = CppClass(name="Cls")
         variable = CppVariable(name="COUNT", type="int", is_constexpr=True, value="0")
         cls.add_variable(variable)
-        variable.render_to_string_declaration(cpp)
-        self.assertIn("constexpr int COUNT = 0;", writer.getvalue())
+        variable.render_to_string_declaration(self.cpp)
+        self.assertIn("constexpr int COUNT = 0;", self.cpp.getvalue())
 
     def test_is_extern_static_raises(self):
-        writer = io.StringIO()
-        cpp = CppSourceFile(None, writer=writer)
-        var = CppVariable(name="var1", type="char*", is_static=True, is_extern=True)
-        self.assertRaises(ValueError, var.render_to_string, cpp)
+        self.assertRaises(
+            ValueError,
+            CppVariable,
+            name="var1",
+            type="char*",
+            is_static=True,
+            is_extern=True,
+        )
 
     def test_is_extern_render_to_string(self):
-        writer = io.StringIO()
-        cpp = CppSourceFile(None, writer=writer)
         v = CppVariable(name="var1", type="char*", is_extern=True)
-        v.render_to_string(cpp)
-        self.assertIn("extern char* var1;", writer.getvalue())
+        v.render_to_string(self.cpp)
+        self.assertIn("extern char* var1;", self.cpp.getvalue())
+
+    def test_shared_type(self):
+        t = CppTemplateType(type="std::vector", template_args=["int"])
+        v1 = CppVariable(name="var1", type=t, value="{}")
+        v2 = CppVariable(name="var2", type=t, is_const=True, value="{}")
+        v3 = CppVariable(name="var3", type=t, value="{}")
+        self.assertEqual(["std::vector<int> var1 = {};"], v1.emit())
+        self.assertEqual(["const std::vector<int> var2 = {};"], v2.emit())
+
+        # every variable wraps the given type, so the modifiers are not shared
+        v1.type.is_const = True
+        self.assertEqual(["const std::vector<int> var1 = {};"], v1.emit())
+        self.assertEqual(["std::vector<int> var3 = {};"], v3.emit())
+
+    def test_template_args_changed_after_render(self):
+        t = CppTemplateType(type="std::map", template_args=["int"])
+        v = CppVariable(name="var1", type=t, is_const=True, value="{}")
+        self.assertEqual(["const std::map<int> var1 = {};"], v.emit())
+
+        # Declaration must follow the later changes of the template arguments
+        t.template_args.append("bool")
+        self.assertEqual(["const std::map<int, bool> var1 = {};"], v.emit())
+        t.template_args[0] = "char"
+        self.assertEqual(["const std::map<char, bool> var1 = {};"], v.emit())
+
+    def test_emit(self):
+        v = CppVariable(
+            name="var1", type="int", is_const=True, value="0", documentation="// doc"
+        )
+        self.assertEqual(["// doc", "const int var1 = 0;"], v.emit())
+
+    def test_documentation_reassigned(self):
+        v = CppVariable(
+            name="var1", type="int", value="0", documentation="    // old doc"
+        )
+        v.documentation = """
+            // new doc
+            // second line"""
+        v.render_to_string(self.cpp)
+        self.assertEqual(
+            "\n// new doc\n// second line\nint var1 = 0;\n", self.cpp.getvalue()
+        )
+
+    def test_in_memory_source(self):
+        cpp = CppSourceFile(None)
+        variable = CppVariable(name="var1", type="int", is_static=True, value="0")
+        variable.render_to_string(cpp)
+        with cpp.block("namespace ns") as block:
+            block("int var2;")
+        self.assertEqual(
+            "static int var1 = 0;\nnamespace ns\n{\n    int var2;\n}\n", cpp.getvalue()
+        )
+        cpp.close()
 
 
 if __name__ == "__main__":